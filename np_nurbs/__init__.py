@@ -62,6 +62,11 @@ coefficient_matrices: dict[int, NDArray[np.int64]] = {
 
 # Delayed import of all functions so that each function can import the
 # just instantiated hashmap of coefficient matrices
+from .kernels import *
 from .bezier import *
 from .rational_bezier import *
+from .intersection import *
+from .bvh import *
+from .mesh import *
+from .integrals import *
 
@@ -1,18 +1,110 @@
+import math
+
 from numpy.typing import NDArray
 import numpy as np
 
 from np_nurbs import coefficient_matrices
+from np_nurbs.kernels import power_basis_eval, uniform_parameters
 
 
 __all__ = [
+    "bernstein_basis_anyderiv",
+    "bezier_monomial_coefficients",
     "bezier_curve_anyderiv_grid",
     "bezier_curve_eval_grid",
     "bezier_curve_dcdt_grid",
     "bezier_curve_d2cdt2_grid",
+    "bezier_surf_anyderiv_grid",
     "bezier_surf_eval_grid",
+    "bezier_surf_dsdu_grid",
+    "bezier_surf_dsdv_grid",
+    "bezier_surf_eval_basis",
+    "bezier_surf_first_derivs_basis",
 ]
 
 
+def bezier_monomial_coefficients(
+    p: NDArray[np.float64],
+    deriv_order: int = 0,
+) -> NDArray[np.float64]:
+    """
+    Converts Bézier control points (along the first axis) to the
+    monomial coefficients of a derivative of any order (including 0)
+    of the Bézier polynomial, in order of decreasing power. The
+    result can be evaluated with ``power_basis_eval``.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Control point array with shape :math:`(n+1) \\times \\ldots`,
+        where :math:`n` is the degree
+    deriv_order: int
+        Order of the derivative. Must not exceed the degree.
+        Default: ``0``
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Coefficient array with shape
+        :math:`(n - r + 1) \\times \\ldots`, where :math:`r` is the
+        derivative order
+    """
+    degree = len(p) - 1
+    m = coefficient_matrices[degree - deriv_order]
+    p_diff = p if deriv_order == 0 else np.diff(p, n=deriv_order, axis=0)
+    c = np.dot(m, p_diff if p.ndim == 2 else p_diff.reshape(len(p_diff), -1))
+    if deriv_order > 0:
+        c *= math.prod(range(degree, degree - deriv_order, -1))
+    return c if p.ndim == 2 else c.reshape(len(m), *p.shape[1:])
+
+
+def bernstein_basis_anyderiv(
+    degree: int,
+    t: NDArray[np.float64],
+    deriv_order: int = 0,
+) -> NDArray[np.float64]:
+    """
+    Evaluates a derivative of any order (including 0) of the
+    Bernstein basis functions of a given degree at an arbitrary
+    set of parameter values. Multiplying the result by a
+    control point array yields the corresponding Bézier curve
+    derivative at each parameter value.
+
+    Parameters
+    ----------
+    degree: int
+        Bernstein polynomial degree :math:`n`
+    t: NDArray[np.float64]
+        One-dimensional array of parameter values with length
+        :math:`n_t`. Values need not be evenly spaced or sorted
+    deriv_order: int
+        Order of the derivative to evaluate. If greater than
+        the degree, an array of zeros is returned
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Basis matrix with shape :math:`n_t \\times (n+1)`
+    """
+    t = np.asarray(t, dtype=np.float64)
+    if deriv_order > degree:
+        return np.zeros(shape=(len(t), degree + 1))
+
+    # Basis of the reduced degree in the same form as the grid kernels
+    reduced_degree = degree - deriv_order
+    powers = (reduced_degree - np.arange(reduced_degree + 1))[:, np.newaxis]
+    t_mat = t ** powers
+    b = np.dot(t_mat.T, coefficient_matrices[reduced_degree])
+    if deriv_order == 0:
+        return b
+
+    # Fold the forward difference operator into the basis so that the
+    # result applies directly to the undifferenced control points
+    diff_operator = np.diff(np.eye(degree + 1), n=deriv_order, axis=0)
+    degree_product = np.prod(np.arange(degree, degree - deriv_order, -1))
+    return degree_product * np.dot(b, diff_operator)
+
+
 def bezier_curve_anyderiv_grid(
     p: NDArray[np.float64], 
     nt: int,
@@ -56,25 +148,12 @@ def bezier_curve_anyderiv_grid(
     if deriv_order >= degree:
         return np.zeros(shape=(nt, p.shape[1]))
 
-    # Configure t matrix
-    t = np.linspace(0.0, 1.0, nt, dtype=np.float64)
-    powers = (degree - deriv_order - np.arange(
-        degree + 1 - deriv_order))[:, np.newaxis]
-    t_mat = t ** powers
-    
-    # Grab the Pascal's triangle coefficient matrix from the stored hashmap
-    m = coefficient_matrices[degree - deriv_order]
-
-    # Get the control point or control point difference matrix
-    p_diff = p if deriv_order == 0 else np.diff(p, n=deriv_order, axis=0)
-    
-    # Compute the product
-    degree_product = 1 if deriv_order == 0 else np.prod(np.arange(
-        degree, degree - deriv_order, -1))
-    a = np.dot(t_mat.T, m)
-    b = degree_product * np.dot(a, p_diff)
-    
-    return b
+    # Fold the Pascal's triangle coefficient matrix and the control
+    # point differences into monomial coefficients once, so that the
+    # per-parameter work is a single power basis evaluation
+    t = uniform_parameters(nt)
+    c = bezier_monomial_coefficients(p, deriv_order)
+    return power_basis_eval(c, t)
 
 
 def bezier_curve_eval_grid(
@@ -202,17 +281,219 @@ def bezier_surf_eval_grid(
         :math:`u`-direction and :math:`n_v` is the number
         of parameters in the :math:`v`-direction
     """
+    return bezier_surf_anyderiv_grid(p, nu, nv, 0, 0)
+
+
+def bezier_surf_anyderiv_grid(
+    p: NDArray[np.float64],
+    nu: int,
+    nv: int,
+    deriv_u: int,
+    deriv_v: int,
+) -> NDArray[np.float64]:
+    """
+    Evaluates a mixed partial derivative of any order (including
+    0, which implies a pure surface evaluation) of a Bézier surface
+    on a uniform parameter grid
+    (``linspace(0, 1, nu), linspace(0, 1, nv)``)
+    using a fully vectorized formulation.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Bézier surface control point array. This array has shape
+        :math:`(n+1) \\times (m+1) \\times d`, where :math:`n` is
+        the surface degree in the :math:`u`-direction,
+        :math:`m` is the surface degree in the :math:`v`-direction,
+        and :math:`d` is the number of dimensions (usually 3)
+    nu: int
+        Number of evenly spaced parameters at which to
+        evaluate the derivative in the :math:`u`-direction
+    nv: int
+        Number of evenly spaced parameters at which to
+        evaluate the derivative in the :math:`v`-direction
+    deriv_u: int
+        Order of the derivative with respect to :math:`u`
+    deriv_v: int
+        Order of the derivative with respect to :math:`v`
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The evaluated Bézier surface derivative with shape
+        :math:`n_u \\times n_v \\times d`, where :math:`n_u`
+        is the number of parameters in the
+        :math:`u`-direction and :math:`n_v` is the number
+        of parameters in the :math:`v`-direction
+    """
+    if deriv_u > p.shape[0] - 1 or deriv_v > p.shape[1] - 1:
+        return np.zeros(shape=(nu, nv, p.shape[2]))
+
     n = p.shape[0] - 1
     m = p.shape[1] - 1
-    u = np.linspace(0.0, 1.0, nu, dtype=np.float64)
-    v = np.linspace(0.0, 1.0, nv, dtype=np.float64)
-    u_powers = (n - np.arange(n + 1))[:, np.newaxis]
-    v_powers = (m - np.arange(m + 1))[:, np.newaxis]
-    u_mat = u ** u_powers
-    v_mat = v ** v_powers
-    bu = np.dot(u_mat.T, coefficient_matrices[n])
-    bv = np.dot(v_mat.T, coefficient_matrices[m])
-    a = np.dot(bv, p)
-    b = np.dot(bu, a)
-    return b
+    d = p.shape[2]
+    u = uniform_parameters(nu)
+    v = uniform_parameters(nv)
 
+    # Evaluate along v for every row of control points, then along u.
+    # The intermediate arrays are kept two-dimensional so that every
+    # product is a single BLAS call
+    cv = bezier_monomial_coefficients(p.swapaxes(0, 1).reshape(m + 1, -1), deriv_v)
+    a = power_basis_eval(cv, v).reshape(nv, n + 1, d).swapaxes(0, 1).reshape(n + 1, -1)
+    cu = bezier_monomial_coefficients(a, deriv_u)
+    return power_basis_eval(cu, u).reshape(nu, nv, d)
+
+
+def bezier_surf_dsdu_grid(
+    p: NDArray[np.float64],
+    nu: int,
+    nv: int,
+) -> NDArray[np.float64]:
+    """
+    Evaluates the first partial derivative of a Bézier surface with
+    respect to :math:`u` on a uniform parameter grid
+    (``linspace(0, 1, nu), linspace(0, 1, nv)``)
+    using a fully vectorized formulation.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Bézier surface control point array. This array has shape
+        :math:`(n+1) \\times (m+1) \\times d`, where :math:`n` is
+        the surface degree in the :math:`u`-direction,
+        :math:`m` is the surface degree in the :math:`v`-direction,
+        and :math:`d` is the number of dimensions (usually 3)
+    nu: int
+        Number of evenly spaced parameters at which to
+        evaluate the derivative in the :math:`u`-direction
+    nv: int
+        Number of evenly spaced parameters at which to
+        evaluate the derivative in the :math:`v`-direction
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The evaluated derivative with shape
+        :math:`n_u \\times n_v \\times d`
+    """
+    return bezier_surf_anyderiv_grid(p, nu, nv, 1, 0)
+
+
+def bezier_surf_dsdv_grid(
+    p: NDArray[np.float64],
+    nu: int,
+    nv: int,
+) -> NDArray[np.float64]:
+    """
+    Evaluates the first partial derivative of a Bézier surface with
+    respect to :math:`v` on a uniform parameter grid
+    (``linspace(0, 1, nu), linspace(0, 1, nv)``)
+    using a fully vectorized formulation.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Bézier surface control point array. This array has shape
+        :math:`(n+1) \\times (m+1) \\times d`, where :math:`n` is
+        the surface degree in the :math:`u`-direction,
+        :math:`m` is the surface degree in the :math:`v`-direction,
+        and :math:`d` is the number of dimensions (usually 3)
+    nu: int
+        Number of evenly spaced parameters at which to
+        evaluate the derivative in the :math:`u`-direction
+    nv: int
+        Number of evenly spaced parameters at which to
+        evaluate the derivative in the :math:`v`-direction
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The evaluated derivative with shape
+        :math:`n_u \\times n_v \\times d`
+    """
+    return bezier_surf_anyderiv_grid(p, nu, nv, 0, 1)
+
+
+def bezier_surf_eval_basis(
+    p: NDArray[np.float64],
+    bu: NDArray[np.float64],
+    bv: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Evaluates a batch of Bézier surfaces of the same degree (or one
+    of their partial derivatives) on a tensor-product parameter grid
+    from precomputed Bernstein basis matrices, such as those returned
+    by ``bernstein_basis_anyderiv``. Both contractions are batched
+    matrix products, so no per-surface loop is required.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Bézier surface control point array with shape
+        :math:`n_b \\times (n+1) \\times (m+1) \\times d`
+    bu: NDArray[np.float64]
+        Basis (or basis derivative) matrix in the :math:`u`-direction
+        with shape :math:`n_u \\times (n+1)`
+    bv: NDArray[np.float64]
+        Basis (or basis derivative) matrix in the :math:`v`-direction
+        with shape :math:`n_v \\times (m+1)`
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The evaluated surfaces with shape
+        :math:`n_b \\times n_u \\times n_v \\times d`
+    """
+    n_b, n_plus_1, _, d = p.shape
+    pv = np.matmul(bv, p).reshape(n_b, n_plus_1, -1)
+    return np.matmul(bu, pv).reshape(n_b, len(bu), len(bv), d)
+
+
+def bezier_surf_first_derivs_basis(
+    p: NDArray[np.float64],
+    bu: NDArray[np.float64],
+    bv: NDArray[np.float64],
+    dbu: NDArray[np.float64],
+    dbv: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Evaluates a batch of Bézier surfaces of the same degree and their
+    first partial derivatives on a tensor-product parameter grid from
+    precomputed Bernstein basis matrices. The contraction over
+    :math:`v` is performed first so that its result is shared between
+    the point and :math:`\\partial S / \\partial u` evaluations.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Bézier surface control point array with shape
+        :math:`n_b \\times (n+1) \\times (m+1) \\times d`
+    bu: NDArray[np.float64]
+        Basis matrix in the :math:`u`-direction with shape
+        :math:`n_u \\times (n+1)`
+    bv: NDArray[np.float64]
+        Basis matrix in the :math:`v`-direction with shape
+        :math:`n_v \\times (m+1)`
+    dbu: NDArray[np.float64]
+        First derivative of the basis matrix in the
+        :math:`u`-direction with shape :math:`n_u \\times (n+1)`
+    dbv: NDArray[np.float64]
+        First derivative of the basis matrix in the
+        :math:`v`-direction with shape :math:`n_v \\times (m+1)`
+
+    Returns
+    -------
+    tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        Surface points, :math:`\\partial S / \\partial u`, and
+        :math:`\\partial S / \\partial v`, each with shape
+        :math:`n_b \\times n_u \\times n_v \\times d`
+    """
+    n_b, n_plus_1, _, d = p.shape
+    shape = (n_b, len(bu), len(bv), d)
+    pv = np.matmul(bv, p).reshape(n_b, n_plus_1, -1)
+    dpv = np.matmul(dbv, p).reshape(n_b, n_plus_1, -1)
+    return (
+        np.matmul(bu, pv).reshape(shape),
+        np.matmul(dbu, pv).reshape(shape),
+        np.matmul(bu, dpv).reshape(shape),
+    )
@@ -0,0 +1,440 @@
+from collections.abc import Sequence
+
+from numpy.typing import NDArray
+import numpy as np
+
+from np_nurbs.bezier import bernstein_basis_anyderiv, bezier_surf_eval_basis
+from np_nurbs.kernels import uniform_parameters
+
+
+__all__ = [
+    "BezierBVH",
+    "bvh_surf_nearest_grid",
+]
+
+
+def _control_net_bounding_boxes(
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Computes the axis-aligned bounding box of the control net of each
+    curve or surface. By the convex hull property (which also holds
+    for rational patches with positive weights), each box bounds the
+    corresponding curve or surface.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+        Either a single array of control nets with the patch index
+        along the first axis and the spatial dimension along the last
+        axis, or a sequence of individual control nets (which may
+        have different degrees)
+
+    Returns
+    -------
+    tuple[NDArray[np.float64], NDArray[np.float64]]
+        Lower and upper box corners, each with shape
+        :math:`n_p \\times d`
+    """
+    if isinstance(p, np.ndarray):
+        reduce_axes = tuple(range(1, p.ndim - 1))
+        return p.min(axis=reduce_axes), p.max(axis=reduce_axes)
+    flat = [np.reshape(pi, (-1, pi.shape[-1])) for pi in p]
+    if not flat:
+        return np.empty((0, 0)), np.empty((0, 0))
+    return (
+        np.array([pi.min(axis=0) for pi in flat]),
+        np.array([pi.max(axis=0) for pi in flat]),
+    )
+
+
+def _morton_codes(
+    points: NDArray[np.float64],
+    lo: NDArray[np.float64],
+    hi: NDArray[np.float64],
+) -> NDArray[np.uint64]:
+    """
+    Computes 30-bit Morton (Z-order) codes of a set of points after
+    mapping the box ``[lo, hi]`` to the unit cube (points outside
+    the box are clamped to it). Only the first three coordinates
+    are used, and two-dimensional points are padded with zeros.
+    """
+    ncoord = min(points.shape[1], 3)
+    xyz = np.zeros((len(points), 3))
+    xyz[:, :ncoord] = points[:, :ncoord] - lo[:ncoord]
+    extent = np.ones(3)
+    extent[:ncoord] = np.where(hi[:ncoord] > lo[:ncoord], hi[:ncoord] - lo[:ncoord], 1.0)
+    q = np.clip(xyz / extent * 1023.0, 0.0, 1023.0).astype(np.uint64)
+
+    # Spread the 10 bits of each coordinate so that they occupy every
+    # third bit position
+    for shift, mask in ((16, 0x030000FF), (8, 0x0300F00F), (4, 0x030C30C3), (2, 0x09249249)):
+        q = (q | (q << np.uint64(shift))) & np.uint64(mask)
+    return (q[:, 0] << np.uint64(2)) | (q[:, 1] << np.uint64(1)) | q[:, 2]
+
+
+class BezierBVH:
+    """
+    Bounding volume hierarchy over the control net bounding boxes of a
+    set of Bézier or rational Bézier curves or surfaces. The hierarchy
+    is stored as a complete binary tree in flat arrays (the children
+    of node :math:`i` are nodes :math:`2i+1` and :math:`2i+2`). Patches
+    are ordered along a Morton curve through their box centroids and
+    grouped into leaves of ``leaf_size`` patches.
+
+    All queries are batched: the traversal advances every query
+    through one tree level at a time using array operations, so no
+    per-query or per-node Python loop is required.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+        Either a single array of control nets with the patch index
+        along the first axis and the spatial dimension along the last
+        axis, or a sequence of individual control nets (which may
+        have different degrees)
+    leaf_size: int
+        Maximum number of patches per leaf. Default: ``4``
+    """
+
+    def __init__(
+        self,
+        p: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+        leaf_size: int = 4,
+    ):
+        self.patch_lo, self.patch_hi = _control_net_bounding_boxes(p)
+        self.leaf_size = leaf_size
+        n_patches, dim = self.patch_lo.shape
+
+        # Pad the number of leaves to a power of two so that every leaf
+        # sits at the same depth of the implicit tree
+        n_leaves = max(1, -(-n_patches // leaf_size))
+        self.depth = int(np.ceil(np.log2(n_leaves)))
+        self.n_leaves = 2 ** self.depth
+        self.first_leaf = self.n_leaves - 1
+
+        # Leaf slots hold patch indices in Morton order, with -1 marking
+        # unused slots. The sorted codes are kept to seed nearest
+        # point queries
+        centroids = 0.5 * (self.patch_lo + self.patch_hi)
+        if n_patches > 0:
+            self.morton_lo, self.morton_hi = centroids.min(axis=0), centroids.max(axis=0)
+            codes = _morton_codes(centroids, self.morton_lo, self.morton_hi)
+            order = np.argsort(codes, kind="stable")
+            self.morton_codes = codes[order]
+        else:
+            order = np.empty(0, dtype=np.int64)
+        self.slots = np.full(self.n_leaves * leaf_size, -1, dtype=np.int64)
+        self.slots[:n_patches] = order
+        self.slots = self.slots.reshape(self.n_leaves, leaf_size)
+        self.patch_leaf = np.empty(n_patches, dtype=np.int64)
+        self.patch_leaf[order] = np.arange(n_patches) // leaf_size
+
+        n_nodes = 2 * self.n_leaves - 1
+        self.node_lo = np.full((n_nodes, dim), np.inf)
+        self.node_hi = np.full((n_nodes, dim), -np.inf)
+        self.node_used = np.zeros(n_nodes, dtype=bool)
+        if n_patches == 0:
+            return
+        self._refit_leaves(np.arange(self.n_leaves))
+        for level in range(self.depth - 1, -1, -1):
+            self._refit_nodes(np.arange(2 ** level - 1, 2 ** (level + 1) - 1))
+
+        # Nodes covering only padding leaves have empty (inverted) boxes.
+        # Refitting never changes which leaves hold patches, so these
+        # nodes are flagged once here and skipped during traversal
+        self.node_used = np.all(self.node_lo <= self.node_hi, axis=1)
+
+    def _refit_leaves(self, leaves: NDArray[np.int64]):
+        slots = self.slots[leaves]
+        valid = (slots >= 0)[:, :, np.newaxis]
+        self.node_lo[self.first_leaf + leaves] = np.where(
+            valid, self.patch_lo[slots], np.inf).min(axis=1)
+        self.node_hi[self.first_leaf + leaves] = np.where(
+            valid, self.patch_hi[slots], -np.inf).max(axis=1)
+
+    def _refit_nodes(self, nodes: NDArray[np.int64]):
+        self.node_lo[nodes] = np.minimum(self.node_lo[2 * nodes + 1], self.node_lo[2 * nodes + 2])
+        self.node_hi[nodes] = np.maximum(self.node_hi[2 * nodes + 1], self.node_hi[2 * nodes + 2])
+
+    def refit(
+        self,
+        p: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+        patch_indices: NDArray[np.int64] | None = None,
+    ):
+        """
+        Updates the hierarchy after control points have moved. Only
+        the leaves containing the modified patches and their
+        ancestors are recomputed; the tree topology is kept.
+        Rebuild the hierarchy instead if the patches have moved
+        far enough that query performance degrades.
+
+        Parameters
+        ----------
+        p: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+            New control nets of the modified patches, in the same
+            format as used for construction
+        patch_indices: NDArray[np.int64] | None
+            Indices of the modified patches, corresponding
+            one-to-one with ``p``. If ``None``, ``p`` must contain
+            every patch. Default: ``None``
+        """
+        lo, hi = _control_net_bounding_boxes(p)
+        if patch_indices is None:
+            patch_indices = np.arange(len(self.patch_lo))
+        assert len(lo) == len(patch_indices)
+        self.patch_lo[patch_indices] = lo
+        self.patch_hi[patch_indices] = hi
+
+        leaves = np.unique(self.patch_leaf[patch_indices])
+        self._refit_leaves(leaves)
+        nodes = self.first_leaf + leaves
+        for _ in range(self.depth):
+            nodes = np.unique((nodes - 1) // 2)
+            self._refit_nodes(nodes)
+
+    def _traverse(self, n_queries: int, box_test) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Traverses the hierarchy for a batch of queries, one level at a
+        time. ``box_test(query_idx, lo, hi)`` returns a mask of the
+        query-box pairs to keep and is applied to the node boxes at
+        every level and finally to the individual patch boxes. Nodes
+        that hold only padding leaves are discarded before they are
+        tested.
+        """
+        if len(self.patch_lo) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        query_idx = np.arange(n_queries)
+        nodes = np.zeros(n_queries, dtype=np.int64)
+        for level in range(self.depth + 1):
+            keep = box_test(query_idx, self.node_lo[nodes], self.node_hi[nodes])
+            query_idx, nodes = query_idx[keep], nodes[keep]
+            if level < self.depth:
+                query_idx = np.repeat(query_idx, 2)
+                nodes = np.repeat(2 * nodes, 2) + np.tile([1, 2], len(nodes))
+                used = self.node_used[nodes]
+                query_idx, nodes = query_idx[used], nodes[used]
+
+        patch_idx = self.slots[nodes - self.first_leaf].ravel()
+        query_idx = np.repeat(query_idx, self.leaf_size)
+        valid = patch_idx >= 0
+        query_idx, patch_idx = query_idx[valid], patch_idx[valid]
+        keep = box_test(query_idx, self.patch_lo[patch_idx], self.patch_hi[patch_idx])
+        return query_idx[keep], patch_idx[keep]
+
+    def query_boxes(
+        self,
+        lo: NDArray[np.float64],
+        hi: NDArray[np.float64],
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Finds the patches whose bounding boxes overlap each of a batch
+        of query boxes
+
+        Parameters
+        ----------
+        lo: NDArray[np.float64]
+            Lower corners of the query boxes with shape
+            :math:`n_q \\times d`
+        hi: NDArray[np.float64]
+            Upper corners of the query boxes with shape
+            :math:`n_q \\times d`
+
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.int64]]
+            Query index and patch index of each overlapping pair
+        """
+        def box_test(q, node_lo, node_hi):
+            return np.all((node_lo <= hi[q]) & (lo[q] <= node_hi), axis=-1)
+
+        return self._traverse(len(lo), box_test)
+
+    def query_rays(
+        self,
+        origins: NDArray[np.float64],
+        directions: NDArray[np.float64],
+        t_max: float = np.inf,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Finds the patches whose bounding boxes are hit by each of a
+        batch of rays :math:`\\mathbf{o} + t \\mathbf{d}`,
+        :math:`0 \\leq t \\leq t_{max}`. The resulting candidate
+        pairs can be refined exactly, for example by passing the
+        rays as degree-1 curves to ``bezier_curve_surf_intersect``.
+
+        Parameters
+        ----------
+        origins: NDArray[np.float64]
+            Ray origins with shape :math:`n_q \\times d`
+        directions: NDArray[np.float64]
+            Ray directions with shape :math:`n_q \\times d`.
+            These need not be normalized
+        t_max: float
+            Maximum ray parameter. Default: ``inf``
+
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.int64]]
+            Query index and patch index of each candidate pair
+        """
+        with np.errstate(divide="ignore"):
+            inv_dir = 1.0 / directions
+
+        def box_test(q, node_lo, node_hi):
+            with np.errstate(invalid="ignore"):
+                t1 = (node_lo - origins[q]) * inv_dir[q]
+                t2 = (node_hi - origins[q]) * inv_dir[q]
+            # NaN arises for a zero direction component with the origin
+            # on a slab boundary; treat that slab as unbounded
+            t_near = np.nan_to_num(np.minimum(t1, t2), nan=-np.inf).max(axis=-1)
+            t_far = np.nan_to_num(np.maximum(t1, t2), nan=np.inf).min(axis=-1)
+            return (t_near <= t_far) & (t_far >= 0.0) & (t_near <= t_max)
+
+        return self._traverse(len(origins), box_test)
+
+    def query_nearest(
+        self,
+        points: NDArray[np.float64],
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Finds, for each of a batch of points, the patches that may
+        contain the nearest point to it. A box is pruned when its
+        minimum distance to the query point exceeds the smallest
+        maximum (farthest corner) distance found so far, which is a
+        valid upper bound because every patch touches its box. The
+        bound of each query is seeded from the patches of the leaf
+        that its Morton code falls in, so that pruning is already
+        effective near the root.
+
+        Parameters
+        ----------
+        points: NDArray[np.float64]
+            Query points with shape :math:`n_q \\times d`
+
+        Returns
+        -------
+        tuple[NDArray[np.int64], NDArray[np.int64]]
+            Query index and patch index of each candidate pair
+        """
+        def max_dist(x, lo, hi):
+            return np.linalg.norm(np.maximum(np.abs(x - lo), np.abs(x - hi)), axis=-1)
+
+        upper_bound = np.full(len(points), np.inf)
+        n_patches = len(self.patch_lo)
+        if n_patches > 0:
+            codes = _morton_codes(points, self.morton_lo, self.morton_hi)
+            leaves = np.minimum(np.searchsorted(self.morton_codes, codes), n_patches - 1) // self.leaf_size
+            slots = self.slots[leaves]
+            seed = max_dist(points[:, np.newaxis], self.patch_lo[slots], self.patch_hi[slots])
+            upper_bound = np.where(slots >= 0, seed, np.inf).min(axis=1)
+
+        def box_test(q, node_lo, node_hi):
+            x = points[q]
+            min_dist = np.linalg.norm(x - np.clip(x, node_lo, node_hi), axis=-1)
+            np.minimum.at(upper_bound, q, max_dist(x, node_lo, node_hi))
+            return min_dist <= upper_bound[q]
+
+        return self._traverse(len(points), box_test)
+
+
+def bvh_surf_nearest_grid(
+    bvh: BezierBVH,
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+    points: NDArray[np.float64],
+    nu: int,
+    nv: int,
+    w: NDArray[np.float64] | Sequence[NDArray[np.float64]] | None = None,
+) -> tuple[NDArray[np.int64], NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Finds the nearest point on a set of Bézier or rational Bézier
+    surfaces to each of a batch of points, to the resolution of a
+    uniform parameter grid. Only the candidate patches returned by
+    ``BezierBVH.query_nearest`` are evaluated, each exactly once.
+    Candidates of the same degree are evaluated together with
+    ``bezier_surf_eval_basis`` (in homogeneous coordinates for
+    rational surfaces), so the number of Python iterations depends
+    only on the number of distinct degrees.
+
+    Parameters
+    ----------
+    bvh: BezierBVH
+        Hierarchy built from (or refit to) the control nets ``p``
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+        Surface control nets, each with shape
+        :math:`(n+1) \\times (m+1) \\times d`
+    points: NDArray[np.float64]
+        Query points with shape :math:`n_q \\times d`
+    nu: int
+        Number of evenly spaced parameters at which to
+        evaluate each surface in the :math:`u`-direction
+    nv: int
+        Number of evenly spaced parameters at which to
+        evaluate each surface in the :math:`v`-direction
+    w: NDArray[np.float64] | Sequence[NDArray[np.float64]] | None
+        Weights of each rational surface, or ``None`` for
+        non-rational surfaces. Default: ``None``
+
+    Returns
+    -------
+    tuple[NDArray[np.int64], NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        Index of the nearest patch, its :math:`u` and :math:`v`
+        parameters, and the distance, one entry per query point
+    """
+    query_idx, patch_idx = bvh.query_nearest(points)
+    patches, pair_patch = np.unique(patch_idx, return_inverse=True)
+    pair_dist = np.empty(len(patch_idx))
+    pair_flat = np.empty(len(patch_idx), dtype=np.int64)
+
+    # Group the candidate patches by degree so that each group is
+    # evaluated with a single batched contraction
+    if isinstance(p, np.ndarray):
+        groups = [np.arange(len(patches))]
+    else:
+        degree_groups: dict[tuple[int, ...], list[int]] = {}
+        for i, patch in enumerate(patches):
+            degree_groups.setdefault(np.shape(p[patch])[:2], []).append(i)
+        groups = [np.array(group) for group in degree_groups.values()]
+    local_idx = np.empty(len(patches), dtype=np.int64)
+
+    u = uniform_parameters(nu)
+    v = uniform_parameters(nv)
+    for group in groups:
+        if isinstance(p, np.ndarray):
+            pg = p[patches[group]]
+        else:
+            pg = np.stack([p[patch] for patch in patches[group]])
+        bu = bernstein_basis_anyderiv(pg.shape[1] - 1, u, 0)
+        bv = bernstein_basis_anyderiv(pg.shape[2] - 1, v, 0)
+        if w is None:
+            grids = bezier_surf_eval_basis(pg, bu, bv)
+        else:
+            if isinstance(w, np.ndarray):
+                wg = w[patches[group], ..., np.newaxis]
+            else:
+                wg = np.stack([w[patch] for patch in patches[group]])[..., np.newaxis]
+            grids = bezier_surf_eval_basis(np.concatenate((pg * wg, wg), axis=-1), bu, bv)
+            grids = grids[..., :-1] / grids[..., -1:]
+        grids = grids.reshape(len(group), nu * nv, -1)
+
+        local_idx[group] = np.arange(len(group))
+        pairs = np.flatnonzero(np.isin(pair_patch, group))
+        dist = np.linalg.norm(
+            points[query_idx[pairs], np.newaxis] - grids[local_idx[pair_patch[pairs]]], axis=-1)
+        pair_flat[pairs] = dist.argmin(axis=1)
+        pair_dist[pairs] = dist[np.arange(len(pairs)), pair_flat[pairs]]
+
+    # Keep the closest candidate of each query
+    best_dist = np.full(len(points), np.inf)
+    best_patch = np.full(len(points), -1, dtype=np.int64)
+    best_flat = np.zeros(len(points), dtype=np.int64)
+    order = np.lexsort((pair_dist, query_idx))
+    queries, first = np.unique(query_idx[order], return_index=True)
+    best = order[first]
+    best_dist[queries] = pair_dist[best]
+    best_patch[queries] = patch_idx[best]
+    best_flat[queries] = pair_flat[best]
+
+    iu, iv = np.divmod(best_flat, nv)
+    return best_patch, iu / max(nu - 1, 1), iv / max(nv - 1, 1), best_dist
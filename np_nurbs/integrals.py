@@ -0,0 +1,419 @@
+from collections.abc import Sequence
+from functools import lru_cache
+
+from numpy.typing import NDArray
+import numpy as np
+
+from np_nurbs.bezier import bernstein_basis_anyderiv, bezier_surf_first_derivs_basis
+
+
+__all__ = [
+    "bezier_curve_length",
+    "rational_bezier_curve_length",
+    "bezier_surf_area",
+    "rational_bezier_surf_area",
+    "bezier_surf_volume",
+    "rational_bezier_surf_volume",
+    "bezier_surf_volume_centroid",
+    "rational_bezier_surf_volume_centroid",
+]
+
+
+@lru_cache(maxsize=None)
+def _gauss_legendre(n_nodes: int) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Gauss-Legendre nodes and weights mapped to :math:`[0, 1]`. The
+    returned arrays are cached and read-only.
+    """
+    x, w = np.polynomial.legendre.leggauss(n_nodes)
+    x, w = 0.5 * (x + 1.0), 0.5 * w
+    x.flags.writeable = False
+    w.flags.writeable = False
+    return x, w
+
+
+@lru_cache(maxsize=None)
+def _quadrature_basis(degree: int, n_nodes: int, deriv_order: int) -> NDArray[np.float64]:
+    """
+    Bernstein basis (or basis derivative) matrix at the Gauss-Legendre
+    nodes, with shape :math:`n_q \\times (n+1)`. The returned array is
+    cached and read-only.
+    """
+    b = bernstein_basis_anyderiv(degree, _gauss_legendre(n_nodes)[0], deriv_order)
+    b.flags.writeable = False
+    return b
+
+
+def _homogeneous(
+    p: NDArray[np.float64],
+    w: NDArray[np.float64] | None,
+) -> NDArray[np.float64]:
+    if w is None:
+        return p
+    return np.concatenate((p * w[..., np.newaxis], w[..., np.newaxis]), axis=-1)
+
+
+def _project(
+    a: NDArray[np.float64],
+    *da: NDArray[np.float64],
+) -> list[NDArray[np.float64]]:
+    """
+    Converts homogeneous points and first derivatives to Cartesian
+    points and first derivatives using the quotient rule
+    """
+    weight = a[..., -1:]
+    point = a[..., :-1] / weight
+    return [point] + [(d[..., :-1] - point * d[..., -1:]) / weight for d in da]
+
+
+def _curve_quadrature(
+    p: NDArray[np.float64],
+    w: NDArray[np.float64] | None,
+    n_nodes: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Points and first derivatives of a batch of (rational) Bézier
+    curves at the Gauss-Legendre nodes, each with shape
+    :math:`n_b \\times n_q \\times d`, along with the quadrature
+    weights
+    """
+    degree = p.shape[1] - 1
+    pw = _homogeneous(p, w)
+    a = np.matmul(_quadrature_basis(degree, n_nodes, 0), pw)
+    da = np.matmul(_quadrature_basis(degree, n_nodes, 1), pw)
+    if w is None:
+        return a, da, _gauss_legendre(n_nodes)[1]
+    c, dc = _project(a, da)
+    return c, dc, _gauss_legendre(n_nodes)[1]
+
+
+def _surf_quadrature(
+    p: NDArray[np.float64],
+    w: NDArray[np.float64] | None,
+    n_nodes: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Points and first partial derivatives of a batch of (rational)
+    Bézier surfaces on the tensor-product Gauss-Legendre nodes, each
+    with shape :math:`n_b \\times n_q \\times n_q \\times d`, along
+    with the tensor-product quadrature weights
+    """
+    n = p.shape[1] - 1
+    m = p.shape[2] - 1
+    a, da_du, da_dv = bezier_surf_first_derivs_basis(
+        _homogeneous(p, w),
+        _quadrature_basis(n, n_nodes, 0),
+        _quadrature_basis(m, n_nodes, 0),
+        _quadrature_basis(n, n_nodes, 1),
+        _quadrature_basis(m, n_nodes, 1),
+    )
+
+    weights = np.outer(*[_gauss_legendre(n_nodes)[1]] * 2)
+    if w is None:
+        return a, da_du, da_dv, weights
+    s, ds_du, ds_dv = _project(a, da_du, da_dv)
+    return s, ds_du, ds_dv, weights
+
+
+def _curve_length(
+    p: NDArray[np.float64],
+    w: NDArray[np.float64] | None,
+    n_nodes: int,
+) -> NDArray[np.float64]:
+    if p.ndim == 2:
+        p = p[np.newaxis]
+        w = None if w is None else w[np.newaxis]
+    _, dc, weights = _curve_quadrature(p, w, n_nodes)
+    return np.linalg.norm(dc, axis=-1) @ weights
+
+
+def _surf_area(
+    p: NDArray[np.float64],
+    w: NDArray[np.float64] | None,
+    n_nodes: int,
+) -> NDArray[np.float64]:
+    if p.ndim == 3:
+        p = p[np.newaxis]
+        w = None if w is None else w[np.newaxis]
+    _, ds_du, ds_dv, weights = _surf_quadrature(p, w, n_nodes)
+    return np.einsum("buv,uv->b", np.linalg.norm(np.cross(ds_du, ds_dv), axis=-1), weights)
+
+
+def _surf_volume_moments(
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+    w: NDArray[np.float64] | Sequence[NDArray[np.float64]] | None,
+    n_nodes: int,
+) -> tuple[float, NDArray[np.float64]]:
+    """
+    Computes the volume and first moments of volume of the region
+    enclosed by a closed set of surfaces using the divergence theorem:
+    :math:`V = \\frac{1}{3} \\oint S \\cdot N \\, du \\, dv` and
+    :math:`\\int_V x_i \\, dV = \\frac{1}{2} \\oint S_i^2 N_i \\, du \\, dv`,
+    where
+    :math:`N = \\partial S / \\partial u \\times \\partial S / \\partial v`.
+    The contributions of each same-degree batch are summed.
+    """
+    if isinstance(p, np.ndarray):
+        p_groups: Sequence[NDArray[np.float64]] = [p]
+        w_groups = None if w is None else [np.asarray(w)]
+    else:
+        p_groups, w_groups = p, w
+    volume, moments = 0.0, np.zeros(3)
+    for i, pi in enumerate(p_groups):
+        wi = None if w_groups is None else w_groups[i]
+        if pi.ndim == 3:
+            pi = pi[np.newaxis]
+            wi = None if wi is None else wi[np.newaxis]
+        s, ds_du, ds_dv, weights = _surf_quadrature(pi, wi, n_nodes)
+        normal = np.cross(ds_du, ds_dv)
+        volume += np.einsum("buvd,buvd,uv->", s, normal, weights) / 3.0
+        moments += 0.5 * np.einsum("buvd,buvd,uv->d", s * s, normal, weights)
+    return float(volume), moments
+
+
+def bezier_curve_length(
+    p: NDArray[np.float64],
+    n_nodes: int = 24,
+) -> NDArray[np.float64]:
+    """
+    Computes the arc length of one or more Bézier curves of the same
+    degree using Gauss-Legendre quadrature of the analytic first
+    derivative
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Bézier control point array with shape
+        :math:`(n+1) \\times d` for a single curve or
+        :math:`n_b \\times (n+1) \\times d` for a batch of curves
+    n_nodes: int
+        Number of quadrature nodes. Default: ``24``
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Array of arc lengths with shape :math:`n_b`, or with
+        shape :math:`1` for a single curve
+    """
+    return _curve_length(p, None, n_nodes)
+
+
+def rational_bezier_curve_length(
+    p: NDArray[np.float64],
+    w: NDArray[np.float64],
+    n_nodes: int = 24,
+) -> NDArray[np.float64]:
+    """
+    Computes the arc length of one or more rational Bézier curves of
+    the same degree using Gauss-Legendre quadrature of the analytic
+    first derivative
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Rational Bézier control point array with shape
+        :math:`(n+1) \\times d` for a single curve or
+        :math:`n_b \\times (n+1) \\times d` for a batch of curves
+    w: NDArray[np.float64]
+        Weights, corresponding one-to-one with the control points
+    n_nodes: int
+        Number of quadrature nodes. Default: ``24``
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Array of arc lengths with shape :math:`n_b`, or with
+        shape :math:`1` for a single curve
+    """
+    return _curve_length(p, w, n_nodes)
+
+
+def bezier_surf_area(
+    p: NDArray[np.float64],
+    n_nodes: int = 24,
+) -> NDArray[np.float64]:
+    """
+    Computes the area of one or more Bézier surfaces of the same
+    degrees using tensor-product Gauss-Legendre quadrature of the
+    analytic first partial derivatives
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Bézier surface control point array with shape
+        :math:`(n+1) \\times (m+1) \\times 3` for a single surface or
+        :math:`n_b \\times (n+1) \\times (m+1) \\times 3` for a batch
+        of surfaces
+    n_nodes: int
+        Number of quadrature nodes in each parametric direction.
+        Default: ``24``
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Array of areas with shape :math:`n_b`, or with shape
+        :math:`1` for a single surface
+    """
+    return _surf_area(p, None, n_nodes)
+
+
+def rational_bezier_surf_area(
+    p: NDArray[np.float64],
+    w: NDArray[np.float64],
+    n_nodes: int = 24,
+) -> NDArray[np.float64]:
+    """
+    Computes the area of one or more rational Bézier surfaces of the
+    same degrees using tensor-product Gauss-Legendre quadrature of
+    the analytic first partial derivatives
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Rational Bézier surface control point array with shape
+        :math:`(n+1) \\times (m+1) \\times 3` for a single surface or
+        :math:`n_b \\times (n+1) \\times (m+1) \\times 3` for a batch
+        of surfaces
+    w: NDArray[np.float64]
+        Weights, corresponding one-to-one with the control points
+    n_nodes: int
+        Number of quadrature nodes in each parametric direction.
+        Default: ``24``
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Array of areas with shape :math:`n_b`, or with shape
+        :math:`1` for a single surface
+    """
+    return _surf_area(p, w, n_nodes)
+
+
+def bezier_surf_volume(
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+    n_nodes: int = 24,
+) -> float:
+    """
+    Computes the volume enclosed by a closed set of Bézier surfaces
+    using the divergence theorem and tensor-product Gauss-Legendre
+    quadrature. The surfaces must be
+    oriented so that
+    :math:`\\partial S / \\partial u \\times \\partial S / \\partial v`
+    points out of the enclosed region; the volume is negative if
+    they all point inward. Because the integrand is polynomial, the
+    result is exact for :math:`n_q \\geq 3 \\max(n, m) / 2`.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+        Bézier surface control point array with shape
+        :math:`n_b \\times (n+1) \\times (m+1) \\times 3`, or a
+        sequence of such arrays (one per group of same-degree
+        patches) for patch sets of mixed degree
+    n_nodes: int
+        Number of quadrature nodes in each parametric direction.
+        Default: ``24``
+
+    Returns
+    -------
+    float
+        The enclosed volume
+    """
+    return _surf_volume_moments(p, None, n_nodes)[0]
+
+
+def rational_bezier_surf_volume(
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+    w: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+    n_nodes: int = 24,
+) -> float:
+    """
+    Computes the volume enclosed by a closed set of rational Bézier
+    surfaces using the divergence theorem and tensor-product
+    Gauss-Legendre quadrature. The surfaces must be oriented so that
+    :math:`\\partial S / \\partial u \\times \\partial S / \\partial v`
+    points out of the enclosed region.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+        Rational Bézier surface control point array with shape
+        :math:`n_b \\times (n+1) \\times (m+1) \\times 3`, or a
+        sequence of such arrays (one per group of same-degree
+        patches) for patch sets of mixed degree
+    w: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+        Weights, corresponding one-to-one with the control points
+    n_nodes: int
+        Number of quadrature nodes in each parametric direction.
+        Default: ``24``
+
+    Returns
+    -------
+    float
+        The enclosed volume
+    """
+    return _surf_volume_moments(p, w, n_nodes)[0]
+
+
+def bezier_surf_volume_centroid(
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+    n_nodes: int = 24,
+) -> NDArray[np.float64]:
+    """
+    Computes the centroid of the volume enclosed by a closed set of
+    Bézier surfaces using the divergence theorem and tensor-product
+    Gauss-Legendre quadrature. The surfaces must be oriented
+    consistently, as described in ``bezier_surf_volume``.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+        Bézier surface control point array with shape
+        :math:`n_b \\times (n+1) \\times (m+1) \\times 3`, or a
+        sequence of such arrays (one per group of same-degree
+        patches) for patch sets of mixed degree
+    n_nodes: int
+        Number of quadrature nodes in each parametric direction.
+        Default: ``24``
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The centroid with shape :math:`3`
+    """
+    volume, moments = _surf_volume_moments(p, None, n_nodes)
+    return moments / volume
+
+
+def rational_bezier_surf_volume_centroid(
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+    w: NDArray[np.float64] | Sequence[NDArray[np.float64]],
+    n_nodes: int = 24,
+) -> NDArray[np.float64]:
+    """
+    Computes the centroid of the volume enclosed by a closed set of
+    rational Bézier surfaces using the divergence theorem and
+    tensor-product Gauss-Legendre quadrature. The surfaces must be
+    oriented consistently, as described in
+    ``rational_bezier_surf_volume``.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+        Rational Bézier surface control point array with shape
+        :math:`n_b \\times (n+1) \\times (m+1) \\times 3`, or a
+        sequence of such arrays (one per group of same-degree
+        patches) for patch sets of mixed degree
+    w: NDArray[np.float64] | Sequence[NDArray[np.float64]]
+        Weights, corresponding one-to-one with the control points
+    n_nodes: int
+        Number of quadrature nodes in each parametric direction.
+        Default: ``24``
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The centroid with shape :math:`3`
+    """
+    volume, moments = _surf_volume_moments(p, w, n_nodes)
+    return moments / volume
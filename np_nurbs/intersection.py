@@ -0,0 +1,422 @@
+from numpy.typing import NDArray
+import numpy as np
+
+from np_nurbs.bezier import bernstein_basis_anyderiv
+
+
+__all__ = [
+    "bezier_curve_curve_intersect",
+    "bezier_curve_surf_intersect",
+]
+
+
+def _split_half(
+    p: NDArray[np.float64],
+    axis: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Splits a batch of Bézier control nets at the parameter midpoint
+    along the given axis using de Casteljau's algorithm. The
+    operation is vectorized over every other axis.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Batch of control nets. The axis ``axis`` runs over the
+        control points in the split direction
+    axis: int
+        Axis of ``p`` corresponding to the split direction
+
+    Returns
+    -------
+    tuple[NDArray[np.float64], NDArray[np.float64]]
+        Control nets of the left (:math:`[0, 0.5]`) and
+        right (:math:`[0.5, 1]`) halves, each with the same
+        shape as ``p``
+    """
+    pts = np.moveaxis(p, axis, 0)
+    left, right = [pts[0]], [pts[-1]]
+    for _ in range(pts.shape[0] - 1):
+        pts = 0.5 * (pts[:-1] + pts[1:])
+        left.append(pts[0])
+        right.append(pts[-1])
+    return (
+        np.moveaxis(np.stack(left), 0, axis),
+        np.moveaxis(np.stack(right[::-1]), 0, axis),
+    )
+
+
+def _bounding_boxes(
+    p: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Computes the axis-aligned bounding box of each control net in a
+    batch. By the convex hull property, each box also bounds the
+    corresponding curve or surface.
+    """
+    reduce_axes = tuple(range(1, p.ndim - 1))
+    return p.min(axis=reduce_axes), p.max(axis=reduce_axes)
+
+
+def _boxes_overlap(
+    lo_a: NDArray[np.float64],
+    hi_a: NDArray[np.float64],
+    lo_b: NDArray[np.float64],
+    hi_b: NDArray[np.float64],
+    tol: float,
+) -> NDArray[np.bool_]:
+    """
+    Tests each pair of axis-aligned boxes for overlap, padding each
+    box by ``tol``
+    """
+    return np.all((lo_a <= hi_b + tol) & (lo_b <= hi_a + tol), axis=-1)
+
+
+def _box_diagonals(
+    lo: NDArray[np.float64],
+    hi: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    return np.linalg.norm(hi - lo, axis=-1)
+
+
+def _gauss_newton_step(
+    jac: NDArray[np.float64],
+    residual: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Computes a batched, lightly damped Gauss-Newton step. The
+    damping keeps the normal equations solvable for tangential
+    or degenerate configurations without noticeably affecting
+    convergence for transversal ones.
+
+    Parameters
+    ----------
+    jac: NDArray[np.float64]
+        Batch of Jacobians with shape :math:`k \\times d \\times q`
+    residual: NDArray[np.float64]
+        Batch of residuals with shape :math:`k \\times d`
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Parameter updates with shape :math:`k \\times q`
+    """
+    jtj = np.einsum("kdi,kdj->kij", jac, jac)
+    jtr = np.einsum("kdi,kd->ki", jac, residual)
+    q = jtj.shape[-1]
+    trace = np.trace(jtj, axis1=1, axis2=2)
+    damping = 1e-14 * trace + np.finfo(np.float64).tiny
+    jtj = jtj + damping[:, np.newaxis, np.newaxis] * np.eye(q)
+    return -np.linalg.solve(jtj, jtr[:, :, np.newaxis])[:, :, 0]
+
+
+def _curve_eval(
+    p: NDArray[np.float64],
+    t: NDArray[np.float64],
+    deriv_order: int,
+) -> NDArray[np.float64]:
+    """
+    Evaluates a batch of Bézier curves (or curve derivatives),
+    each at its own parameter value
+    """
+    b = bernstein_basis_anyderiv(p.shape[1] - 1, t, deriv_order)
+    return np.einsum("ki,kid->kd", b, p)
+
+
+def _surf_eval(
+    p: NDArray[np.float64],
+    u: NDArray[np.float64],
+    v: NDArray[np.float64],
+    deriv_u: int,
+    deriv_v: int,
+) -> NDArray[np.float64]:
+    """
+    Evaluates a batch of Bézier surfaces (or surface partial
+    derivatives), each at its own parameter pair
+    """
+    bu = bernstein_basis_anyderiv(p.shape[1] - 1, u, deriv_u)
+    bv = bernstein_basis_anyderiv(p.shape[2] - 1, v, deriv_v)
+    return np.einsum("ki,kj,kijd->kd", bu, bv, p)
+
+
+def _unique_solutions(
+    pair_idx: NDArray[np.int64],
+    params: NDArray[np.float64],
+    tol: float,
+) -> NDArray[np.int64]:
+    """
+    Selects the first occurrence of each distinct solution. Solutions
+    belonging to the same pair whose parameters all agree to within
+    ``tol`` are considered duplicates. Returns the indices of the
+    retained solutions, sorted by pair index and then by the first
+    parameter.
+    """
+    order = np.lexsort((params[:, 0], pair_idx))
+    sorted_pairs = pair_idx[order]
+    sorted_params = params[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = (sorted_pairs[1:] != sorted_pairs[:-1]) | np.any(
+        np.abs(np.diff(sorted_params, axis=0)) > tol, axis=1)
+    return order[keep]
+
+
+def bezier_curve_curve_intersect(
+    p1: NDArray[np.float64],
+    p2: NDArray[np.float64],
+    tol: float = 1e-9,
+    max_depth: int = 10,
+    newton_iter: int = 8,
+) -> tuple[NDArray[np.int64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Computes the intersections between many pairs of Bézier curves
+    at once. Candidate parameter intervals are found by
+    subdividing both curves of every surviving pair at their
+    midpoints with de Casteljau's algorithm, level by level,
+    and discarding pairs of sub-curves whose control polygon
+    bounding boxes do not overlap. Each remaining candidate is then
+    refined with a vectorized Gauss-Newton iteration on the
+    original curves.
+
+    Overlapping curves (for example, identical curves or curves that
+    share a segment) do not have isolated intersections. In that
+    case, every candidate along the shared segment survives to the
+    final subdivision level, and the overlap is returned as a dense
+    sampling of points spaced at the final subdivision interval
+    (on the order of :math:`2^{\\text{max_depth}+1}` points for
+    fully coincident curves). The cost of the call grows accordingly.
+
+    Parameters
+    ----------
+    p1: NDArray[np.float64]
+        Control points of the first curve in each pair. This array
+        has shape :math:`n_p \\times (n+1) \\times d`, where
+        :math:`n_p` is the number of pairs, :math:`n` is the
+        degree, and :math:`d` is the number of dimensions.
+        A single curve with shape :math:`(n+1) \\times d`
+        is also accepted. Curves of different degrees must be
+        intersected in separate calls
+    p2: NDArray[np.float64]
+        Control points of the second curve in each pair, with
+        shape :math:`n_p \\times (m+1) \\times d` or
+        :math:`(m+1) \\times d`
+    tol: float
+        Distance tolerance used to pad the bounding boxes, to stop
+        subdividing candidates, and to accept refined intersections.
+        Default: ``1e-9``
+    max_depth: int
+        Maximum number of subdivision levels. Default: ``10``
+    newton_iter: int
+        Number of Gauss-Newton iterations applied to the
+        surviving candidates. Default: ``8``
+
+    Returns
+    -------
+    tuple[NDArray[np.int64], NDArray[np.float64], NDArray[np.float64]]
+        Index of the pair to which each intersection belongs,
+        parameter value on the first curve, and parameter value
+        on the second curve. The results are sorted by pair index
+        and then by the first curve parameter
+    """
+    p1 = np.asarray(p1, dtype=np.float64)
+    p2 = np.asarray(p2, dtype=np.float64)
+    if p1.ndim == 2:
+        p1 = p1[np.newaxis]
+    if p2.ndim == 2:
+        p2 = p2[np.newaxis]
+    assert len(p1) == len(p2)
+
+    # Candidate state: the pair index, the sub-curve control points,
+    # and the lower end of each sub-curve's parameter interval
+    pair_idx = np.arange(len(p1))
+    a, b = p1, p2
+    t0 = np.zeros(len(p1))
+    s0 = np.zeros(len(p1))
+    width = 1.0
+
+    converged_idx, converged_t, converged_s = [], [], []
+    for level in range(max_depth + 1):
+        lo_a, hi_a = _bounding_boxes(a)
+        lo_b, hi_b = _bounding_boxes(b)
+        keep = _boxes_overlap(lo_a, hi_a, lo_b, hi_b, tol)
+        pair_idx, a, b, t0, s0 = pair_idx[keep], a[keep], b[keep], t0[keep], s0[keep]
+
+        # Candidates with sub-tolerance boxes (or at the final level)
+        # are handed directly to the Newton refinement
+        small = (_box_diagonals(lo_a[keep], hi_a[keep]) < tol) & (
+            _box_diagonals(lo_b[keep], hi_b[keep]) < tol)
+        if level == max_depth:
+            small[:] = True
+        converged_idx.append(pair_idx[small])
+        converged_t.append(t0[small] + 0.5 * width)
+        converged_s.append(s0[small] + 0.5 * width)
+        pair_idx, a, b, t0, s0 = (
+            pair_idx[~small], a[~small], b[~small], t0[~small], s0[~small])
+        if len(pair_idx) == 0:
+            break
+
+        # Split both sub-curves and form all four child combinations
+        width *= 0.5
+        a_left, a_right = _split_half(a, 1)
+        b_left, b_right = _split_half(b, 1)
+        pair_idx = np.tile(pair_idx, 4)
+        a = np.concatenate((a_left, a_left, a_right, a_right))
+        b = np.concatenate((b_left, b_right, b_left, b_right))
+        t0 = np.concatenate((t0, t0, t0 + width, t0 + width))
+        s0 = np.concatenate((s0, s0 + width, s0, s0 + width))
+
+    pair_idx = np.concatenate(converged_idx)
+    t = np.concatenate(converged_t)
+    s = np.concatenate(converged_s)
+    c1, c2 = p1[pair_idx], p2[pair_idx]
+
+    # Refine on the original curves
+    for _ in range(newton_iter):
+        residual = _curve_eval(c1, t, 0) - _curve_eval(c2, s, 0)
+        jac = np.stack((_curve_eval(c1, t, 1), -_curve_eval(c2, s, 1)), axis=-1)
+        step = _gauss_newton_step(jac, residual)
+        t = np.clip(t + step[:, 0], 0.0, 1.0)
+        s = np.clip(s + step[:, 1], 0.0, 1.0)
+
+    residual = _curve_eval(c1, t, 0) - _curve_eval(c2, s, 0)
+    accepted = np.linalg.norm(residual, axis=-1) <= tol
+    pair_idx, t, s = pair_idx[accepted], t[accepted], s[accepted]
+
+    unique = _unique_solutions(pair_idx, np.column_stack((t, s)), np.sqrt(tol))
+    return pair_idx[unique], t[unique], s[unique]
+
+
+def bezier_curve_surf_intersect(
+    p_curve: NDArray[np.float64],
+    p_surf: NDArray[np.float64],
+    tol: float = 1e-9,
+    max_depth: int = 8,
+    newton_iter: int = 8,
+) -> tuple[
+    NDArray[np.int64], NDArray[np.float64],
+    NDArray[np.float64], NDArray[np.float64],
+]:
+    """
+    Computes the intersections between many pairs of
+    three-dimensional Bézier curves and Bézier surfaces at once.
+    At each subdivision level, the curve of every surviving
+    candidate is split in half and the surface is split into
+    quadrants with de Casteljau's algorithm. Children whose
+    control net bounding boxes do not overlap are discarded. Each
+    remaining candidate is then refined with a vectorized
+    Gauss-Newton iteration on the original curve and surface.
+
+    As with ``bezier_curve_curve_intersect``, a curve segment lying
+    in the surface is returned as a dense sampling of points spaced
+    at the final subdivision interval rather than as isolated
+    intersections.
+
+    Parameters
+    ----------
+    p_curve: NDArray[np.float64]
+        Control points of the curve in each pair. This array has
+        shape :math:`n_p \\times (n+1) \\times d`, where
+        :math:`n_p` is the number of pairs and :math:`n` is the
+        curve degree. A single curve with shape
+        :math:`(n+1) \\times d` is also accepted
+    p_surf: NDArray[np.float64]
+        Control points of the surface in each pair, with shape
+        :math:`n_p \\times (m+1) \\times (l+1) \\times d`, where
+        :math:`m` and :math:`l` are the surface degrees in the
+        :math:`u`- and :math:`v`-directions. A single surface
+        with shape :math:`(m+1) \\times (l+1) \\times d` is also
+        accepted
+    tol: float
+        Distance tolerance used to pad the bounding boxes, to stop
+        subdividing candidates, and to accept refined intersections.
+        Default: ``1e-9``
+    max_depth: int
+        Maximum number of subdivision levels. Default: ``8``
+    newton_iter: int
+        Number of Gauss-Newton iterations applied to the
+        surviving candidates. Default: ``8``
+
+    Returns
+    -------
+    tuple[NDArray[np.int64], NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        Index of the pair to which each intersection belongs,
+        curve parameter :math:`t`, and surface parameters
+        :math:`u` and :math:`v`. The results are sorted by pair
+        index and then by the curve parameter
+    """
+    p_curve = np.asarray(p_curve, dtype=np.float64)
+    p_surf = np.asarray(p_surf, dtype=np.float64)
+    if p_curve.ndim == 2:
+        p_curve = p_curve[np.newaxis]
+    if p_surf.ndim == 3:
+        p_surf = p_surf[np.newaxis]
+    assert len(p_curve) == len(p_surf)
+
+    pair_idx = np.arange(len(p_curve))
+    a, b = p_curve, p_surf
+    t0 = np.zeros(len(p_curve))
+    u0 = np.zeros(len(p_curve))
+    v0 = np.zeros(len(p_curve))
+    width = 1.0
+
+    converged_idx, converged_t, converged_u, converged_v = [], [], [], []
+    for level in range(max_depth + 1):
+        lo_a, hi_a = _bounding_boxes(a)
+        lo_b, hi_b = _bounding_boxes(b)
+        keep = _boxes_overlap(lo_a, hi_a, lo_b, hi_b, tol)
+        pair_idx, a, b = pair_idx[keep], a[keep], b[keep]
+        t0, u0, v0 = t0[keep], u0[keep], v0[keep]
+
+        small = (_box_diagonals(lo_a[keep], hi_a[keep]) < tol) & (
+            _box_diagonals(lo_b[keep], hi_b[keep]) < tol)
+        if level == max_depth:
+            small[:] = True
+        converged_idx.append(pair_idx[small])
+        converged_t.append(t0[small] + 0.5 * width)
+        converged_u.append(u0[small] + 0.5 * width)
+        converged_v.append(v0[small] + 0.5 * width)
+        pair_idx, a, b = pair_idx[~small], a[~small], b[~small]
+        t0, u0, v0 = t0[~small], u0[~small], v0[~small]
+        if len(pair_idx) == 0:
+            break
+
+        # Split the curve in half and the surface into quadrants,
+        # then form all eight child combinations
+        width *= 0.5
+        a_halves = _split_half(a, 1)
+        b_quads, u_offsets, v_offsets = [], [], []
+        for iu, b_half in enumerate(_split_half(b, 1)):
+            for iv, b_quad in enumerate(_split_half(b_half, 2)):
+                b_quads.append(b_quad)
+                u_offsets.append(u0 + iu * width)
+                v_offsets.append(v0 + iv * width)
+        pair_idx = np.tile(pair_idx, 8)
+        a = np.concatenate([a_half for a_half in a_halves for _ in range(4)])
+        b = np.concatenate(b_quads * 2)
+        t0 = np.concatenate([t0 + it * width for it in range(2) for _ in range(4)])
+        u0 = np.concatenate(u_offsets * 2)
+        v0 = np.concatenate(v_offsets * 2)
+
+    pair_idx = np.concatenate(converged_idx)
+    t = np.concatenate(converged_t)
+    u = np.concatenate(converged_u)
+    v = np.concatenate(converged_v)
+    c, srf = p_curve[pair_idx], p_surf[pair_idx]
+
+    for _ in range(newton_iter):
+        residual = _curve_eval(c, t, 0) - _surf_eval(srf, u, v, 0, 0)
+        jac = np.stack((
+            _curve_eval(c, t, 1),
+            -_surf_eval(srf, u, v, 1, 0),
+            -_surf_eval(srf, u, v, 0, 1),
+        ), axis=-1)
+        step = _gauss_newton_step(jac, residual)
+        t = np.clip(t + step[:, 0], 0.0, 1.0)
+        u = np.clip(u + step[:, 1], 0.0, 1.0)
+        v = np.clip(v + step[:, 2], 0.0, 1.0)
+
+    residual = _curve_eval(c, t, 0) - _surf_eval(srf, u, v, 0, 0)
+    accepted = np.linalg.norm(residual, axis=-1) <= tol
+    pair_idx, t, u, v = pair_idx[accepted], t[accepted], u[accepted], v[accepted]
+
+    unique = _unique_solutions(pair_idx, np.column_stack((t, u, v)), np.sqrt(tol))
+    return pair_idx[unique], t[unique], u[unique], v[unique]
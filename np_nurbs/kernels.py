@@ -0,0 +1,181 @@
+from functools import lru_cache
+
+from numpy.typing import NDArray
+import numpy as np
+
+
+__all__ = [
+    "power_basis_eval",
+    "power_basis_eval_horner",
+    "power_basis_eval_matmul",
+    "uniform_parameters",
+    "use_horner_kernel",
+]
+
+
+# Measured crossovers of the Horner kernel against the matmul kernel.
+# Horner's scheme costs one pass over the output per degree, so it
+# only wins when the batch is small enough that the matmul kernel is
+# dominated by forming the power matrix, and when there are enough
+# parameter values to amortize the per-degree overhead. The crossover
+# is nearly independent of the degree (tested for degrees 2-15):
+# Horner is faster for a batch of at most 3 once the number of
+# parameter values reaches about 1000 per polynomial
+HORNER_MAX_BATCH = 3
+HORNER_MIN_NT_PER_BATCH = 1000
+
+# Parameter vectors longer than this are not cached, so that large
+# one-off grids are not kept alive by the cache
+UNIFORM_PARAMETERS_MAX_CACHED = 4096
+
+
+@lru_cache(maxsize=64)
+def _cached_uniform_parameters(n: int) -> NDArray[np.float64]:
+    t = np.linspace(0.0, 1.0, n, dtype=np.float64)
+    t.flags.writeable = False
+    return t
+
+
+def uniform_parameters(n: int) -> NDArray[np.float64]:
+    """
+    Evenly spaced parameter vector ``linspace(0, 1, n)``. The result
+    is read-only. Vectors of up to ``UNIFORM_PARAMETERS_MAX_CACHED``
+    values are cached, which removes the cost of rebuilding them on
+    every call for small grids.
+
+    Parameters
+    ----------
+    n: int
+        Number of parameters
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Parameter vector with length :math:`n`
+    """
+    if n <= UNIFORM_PARAMETERS_MAX_CACHED:
+        return _cached_uniform_parameters(n)
+    t = np.linspace(0.0, 1.0, n, dtype=np.float64)
+    t.flags.writeable = False
+    return t
+
+
+def power_basis_eval_matmul(
+    c: NDArray[np.float64],
+    t: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Evaluates a polynomial with array-valued coefficients in the power
+    basis by forming the full matrix of parameter powers and
+    multiplying it by the coefficient matrix
+
+    Parameters
+    ----------
+    c: NDArray[np.float64]
+        Monomial coefficients in order of decreasing power. This
+        array has shape :math:`(n+1) \\times \\ldots`, where :math:`n`
+        is the polynomial degree
+    t: NDArray[np.float64]
+        One-dimensional array of parameter values with length
+        :math:`n_t`
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Polynomial values with shape :math:`n_t \\times \\ldots`
+    """
+    degree = len(c) - 1
+    powers = (degree - np.arange(degree + 1))[:, np.newaxis]
+    t_mat = t ** powers
+    if c.ndim == 2:
+        return np.dot(t_mat.T, c)
+    return np.dot(t_mat.T, c.reshape(degree + 1, -1)).reshape(len(t), *c.shape[1:])
+
+
+def power_basis_eval_horner(
+    c: NDArray[np.float64],
+    t: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Evaluates a polynomial with array-valued coefficients in the power
+    basis using Horner's scheme, vectorized over all parameter
+    values. Only the output array is used as scratch space, and no
+    powers are computed. The output is accumulated with the parameter
+    values along its contiguous axis, so that every update is a
+    unit-stride operation, and its transpose is returned.
+
+    Parameters
+    ----------
+    c: NDArray[np.float64]
+        Monomial coefficients in order of decreasing power. This
+        array has shape :math:`(n+1) \\times \\ldots`, where :math:`n`
+        is the polynomial degree
+    t: NDArray[np.float64]
+        One-dimensional array of parameter values with length
+        :math:`n_t`
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Polynomial values with shape :math:`n_t \\times \\ldots`
+    """
+    c_flat = c.reshape(len(c), -1)
+    out = np.empty((c_flat.shape[1], len(t)), dtype=np.float64)
+    out[:] = c_flat[0][:, np.newaxis]
+    for row in c_flat[1:]:
+        out *= t
+        out += row[:, np.newaxis]
+    return out.T.reshape(len(t), *c.shape[1:])
+
+
+def use_horner_kernel(nt: int, batch: int) -> bool:
+    """
+    Decides whether the Horner kernel should be used in place of the
+    matmul kernel, based on measured crossovers. Horner's scheme is
+    selected only for a batch of at most ``HORNER_MAX_BATCH``
+    polynomials evaluated at no fewer than
+    ``HORNER_MIN_NT_PER_BATCH`` parameter values per polynomial.
+
+    Parameters
+    ----------
+    nt: int
+        Number of parameter values
+    batch: int
+        Number of polynomials evaluated together (the product of the
+        trailing dimensions of the coefficient array)
+
+    Returns
+    -------
+    bool
+        Whether to use the Horner kernel
+    """
+    return batch <= HORNER_MAX_BATCH and nt >= HORNER_MIN_NT_PER_BATCH * batch
+
+
+def power_basis_eval(
+    c: NDArray[np.float64],
+    t: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Evaluates a polynomial with array-valued coefficients in the power
+    basis, choosing between the matmul and Horner kernels based on the
+    number of parameter values and the batch size
+
+    Parameters
+    ----------
+    c: NDArray[np.float64]
+        Monomial coefficients in order of decreasing power. This
+        array has shape :math:`(n+1) \\times \\ldots`, where :math:`n`
+        is the polynomial degree
+    t: NDArray[np.float64]
+        One-dimensional array of parameter values with length
+        :math:`n_t`
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Polynomial values with shape :math:`n_t \\times \\ldots`
+    """
+    if use_horner_kernel(len(t), c.size // len(c)):
+        return power_basis_eval_horner(c, t)
+    return power_basis_eval_matmul(c, t)
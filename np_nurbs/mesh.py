@@ -0,0 +1,270 @@
+from collections.abc import Iterable
+from functools import lru_cache
+import os
+
+from numpy.typing import NDArray
+import numpy as np
+
+from np_nurbs.bezier import bernstein_basis_anyderiv, bezier_surf_first_derivs_basis
+from np_nurbs.kernels import uniform_parameters
+
+
+__all__ = [
+    "grid_triangle_indices",
+    "bezier_surf_tessellate_grid",
+    "write_stl",
+    "write_ply",
+    "write_bezier_surfs_stl",
+]
+
+
+_STL_FACET_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+
+
+@lru_cache(maxsize=None)
+def grid_triangle_indices(nu: int, nv: int) -> NDArray[np.int64]:
+    """
+    Generates the triangle connectivity of a structured
+    :math:`n_u \\times n_v` vertex grid stored in row-major order
+    (vertex :math:`(i, j)` has index :math:`i n_v + j`). Each grid
+    cell is split into two triangles ordered so that their normals
+    point along :math:`\\partial S / \\partial u \\times \\partial S / \\partial v`.
+    The result is cached, so every patch tessellated at the same
+    resolution shares the same (read-only) array.
+
+    Parameters
+    ----------
+    nu: int
+        Number of vertices in the :math:`u`-direction
+    nv: int
+        Number of vertices in the :math:`v`-direction
+
+    Returns
+    -------
+    NDArray[np.int64]
+        Triangle vertex indices with shape
+        :math:`2 (n_u - 1)(n_v - 1) \\times 3`
+    """
+    idx = np.arange(nu * nv).reshape(nu, nv)
+    a = idx[:-1, :-1].ravel()
+    b = idx[1:, :-1].ravel()
+    c = idx[1:, 1:].ravel()
+    d = idx[:-1, 1:].ravel()
+    faces = np.concatenate((
+        np.column_stack((a, b, c)),
+        np.column_stack((a, c, d)),
+    ))
+    faces.flags.writeable = False
+    return faces
+
+
+def bezier_surf_tessellate_grid(
+    p: NDArray[np.float64],
+    nu: int,
+    nv: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.int64]]:
+    """
+    Tessellates a batch of Bézier surfaces of the same degree into a
+    single triangle mesh. Each surface is evaluated on a uniform
+    parameter grid (``linspace(0, 1, nu), linspace(0, 1, nv)``),
+    and the vertex normals are computed from the analytic partial
+    derivatives as
+    :math:`\\partial S / \\partial u \\times \\partial S / \\partial v`.
+    Normals at degenerate points (where the cross product vanishes)
+    are returned as zero vectors.
+
+    Parameters
+    ----------
+    p: NDArray[np.float64]
+        Bézier surface control point array with shape
+        :math:`n_p \\times (n+1) \\times (m+1) \\times 3`, where
+        :math:`n_p` is the number of surfaces. A single surface with
+        shape :math:`(n+1) \\times (m+1) \\times 3` is also accepted
+    nu: int
+        Number of evenly spaced parameters at which to
+        evaluate each surface in the :math:`u`-direction
+    nv: int
+        Number of evenly spaced parameters at which to
+        evaluate each surface in the :math:`v`-direction
+
+    Returns
+    -------
+    tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.int64]]
+        Vertices and unit vertex normals, each with shape
+        :math:`n_p n_u n_v \\times 3`, and triangle vertex indices
+        with shape :math:`2 n_p (n_u - 1)(n_v - 1) \\times 3`
+    """
+    if p.ndim == 3:
+        p = p[np.newaxis]
+    n = p.shape[1] - 1
+    m = p.shape[2] - 1
+    u = uniform_parameters(nu)
+    v = uniform_parameters(nv)
+    s, dsdu, dsdv = bezier_surf_first_derivs_basis(
+        p,
+        bernstein_basis_anyderiv(n, u, 0),
+        bernstein_basis_anyderiv(m, v, 0),
+        bernstein_basis_anyderiv(n, u, 1),
+        bernstein_basis_anyderiv(m, v, 1),
+    )
+    vertices = s.reshape(-1, 3)
+    normals = np.cross(dsdu, dsdv).reshape(-1, 3)
+    length = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, length, out=np.zeros_like(normals), where=length > 0.0)
+
+    offsets = np.arange(len(p)) * (nu * nv)
+    faces = (grid_triangle_indices(nu, nv)[np.newaxis] + offsets[:, np.newaxis, np.newaxis]).reshape(-1, 3)
+    return vertices, normals, faces
+
+
+def _stl_facets(
+    vertices: NDArray[np.float64],
+    faces: NDArray[np.int64],
+) -> NDArray:
+    """
+    Packs triangles into binary STL facet records, computing each
+    facet normal from the triangle edges
+    """
+    tri = vertices[faces]
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    length = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, length, out=normals, where=length > 0.0)
+    facets = np.zeros(len(faces), dtype=_STL_FACET_DTYPE)
+    facets["normal"] = normals
+    facets["vertices"] = tri
+    return facets
+
+
+def _stl_header(n_facets: int) -> bytes:
+    return b"np-nurbs binary STL".ljust(80, b"\0") + np.uint32(n_facets).tobytes()
+
+
+def write_stl(
+    file_name: str | os.PathLike,
+    vertices: NDArray[np.float64],
+    faces: NDArray[np.int64],
+):
+    """
+    Writes a triangle mesh to a binary STL file. The facet records
+    are written directly from the array buffer with one bulk write,
+    without an intermediate copy. Facet normals are computed from
+    the triangle edges.
+
+    Parameters
+    ----------
+    file_name: str | os.PathLike
+        Path of the STL file to write
+    vertices: NDArray[np.float64]
+        Vertex array with shape :math:`n_{vert} \\times 3`
+    faces: NDArray[np.int64]
+        Triangle vertex indices with shape :math:`n_{tri} \\times 3`
+    """
+    facets = _stl_facets(vertices, faces)
+    with open(file_name, "wb") as stl_file:
+        stl_file.write(_stl_header(len(facets)))
+        facets.tofile(stl_file)
+
+
+def write_ply(
+    file_name: str | os.PathLike,
+    vertices: NDArray[np.float64],
+    faces: NDArray[np.int64],
+    normals: NDArray[np.float64] | None = None,
+):
+    """
+    Writes a triangle mesh to a binary little-endian PLY file. The
+    vertex and face records are written directly from their array
+    buffers, without an intermediate copy
+
+    Parameters
+    ----------
+    file_name: str | os.PathLike
+        Path of the PLY file to write
+    vertices: NDArray[np.float64]
+        Vertex array with shape :math:`n_{vert} \\times 3`
+    faces: NDArray[np.int64]
+        Triangle vertex indices with shape :math:`n_{tri} \\times 3`
+    normals: NDArray[np.float64] | None
+        Optional vertex normal array with shape
+        :math:`n_{vert} \\times 3`. Default: ``None``
+    """
+    vertex_fields = [("x", "<f4"), ("y", "<f4"), ("z", "<f4")]
+    if normals is not None:
+        vertex_fields += [("nx", "<f4"), ("ny", "<f4"), ("nz", "<f4")]
+    vertex_data = np.empty(len(vertices), dtype=vertex_fields)
+    for i, axis in enumerate("xyz"):
+        vertex_data[axis] = vertices[:, i]
+        if normals is not None:
+            vertex_data[f"n{axis}"] = normals[:, i]
+
+    face_data = np.empty(len(faces), dtype=[("count", "u1"), ("indices", "<i4", (3,))])
+    face_data["count"] = 3
+    face_data["indices"] = faces
+
+    header = [
+        "ply",
+        "format binary_little_endian 1.0",
+        f"element vertex {len(vertices)}",
+        *[f"property float {name}" for name, _ in vertex_fields],
+        f"element face {len(faces)}",
+        "property list uchar int vertex_indices",
+        "end_header",
+    ]
+    with open(file_name, "wb") as ply_file:
+        ply_file.write(("\n".join(header) + "\n").encode("ascii"))
+        vertex_data.tofile(ply_file)
+        face_data.tofile(ply_file)
+
+
+def write_bezier_surfs_stl(
+    file_name: str | os.PathLike,
+    p: NDArray[np.float64] | Iterable[NDArray[np.float64]],
+    nu: int,
+    nv: int,
+    chunk_size: int = 1024,
+):
+    """
+    Tessellates a set of Bézier surfaces and streams the triangles
+    to a binary STL file without holding the whole mesh in memory.
+    The surfaces are tessellated and written ``chunk_size``
+    patches at a time with one write per chunk, and the facet count
+    in the header is filled in once all chunks have been written.
+
+    Parameters
+    ----------
+    file_name: str | os.PathLike
+        Path of the STL file to write
+    p: NDArray[np.float64] | Iterable[NDArray[np.float64]]
+        Either an array of same-degree Bézier surface control nets
+        with shape :math:`n_p \\times (n+1) \\times (m+1) \\times 3`,
+        or an iterable (such as a generator) yielding single control
+        nets or batches of same-degree control nets. Different
+        items may have different degrees
+    nu: int
+        Number of evenly spaced parameters at which to
+        evaluate each surface in the :math:`u`-direction
+    nv: int
+        Number of evenly spaced parameters at which to
+        evaluate each surface in the :math:`v`-direction
+    chunk_size: int
+        Maximum number of patches tessellated at once when ``p``
+        is an array. Default: ``1024``
+    """
+    if isinstance(p, np.ndarray):
+        chunks = (p[i:i + chunk_size] for i in range(0, len(p), chunk_size))
+    else:
+        chunks = p
+
+    n_facets = 0
+    with open(file_name, "wb") as stl_file:
+        stl_file.write(_stl_header(0))
+        for chunk in chunks:
+            vertices, _, faces = bezier_surf_tessellate_grid(chunk, nu, nv)
+            _stl_facets(vertices, faces).tofile(stl_file)
+            n_facets += len(faces)
+        stl_file.seek(80)
+        stl_file.write(np.uint32(n_facets).tobytes())
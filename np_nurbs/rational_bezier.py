@@ -1,7 +1,8 @@
 from numpy.typing import NDArray
 import numpy as np
 
-from np_nurbs import coefficient_matrices
+from np_nurbs.bezier import bezier_monomial_coefficients, bezier_surf_anyderiv_grid
+from np_nurbs.kernels import power_basis_eval, uniform_parameters
 
 
 __all__ = [
@@ -42,19 +43,13 @@ def rational_bezier_curve_eval_grid(
         is the number of parameters
     """
     assert len(p) == len(w)
-    degree = len(p) - 1
-    t = np.linspace(0.0, 1.0, nt, dtype=np.float64)
-    powers = (degree - np.arange(degree + 1))[:, np.newaxis]
-    t_mat = t ** powers
-    
-    m = coefficient_matrices[degree]
+    t = uniform_parameters(nt)
 
     # Homogeneous control points
     pw = np.insert(p, p.shape[-1], 1.0, axis=1)
     pw = pw * w[:, np.newaxis]
 
-    a = np.dot(t_mat.T, m)
-    b = np.dot(a, pw)
+    b = power_basis_eval(bezier_monomial_coefficients(pw), t)
 
     return b[:, :-1] / b[:, -1][:, np.newaxis]
 
@@ -98,22 +93,10 @@ def rational_bezier_surf_eval_grid(
         :math:`u`-direction and :math:`n_v` is the number
         of parameters in the :math:`v`-direction
     """
-    n = p.shape[0] - 1
-    m = p.shape[1] - 1
-    u = np.linspace(0.0, 1.0, nu, dtype=np.float64)
-    v = np.linspace(0.0, 1.0, nv, dtype=np.float64)
-    u_powers = (n - np.arange(n + 1))[:, np.newaxis]
-    v_powers = (m - np.arange(m + 1))[:, np.newaxis]
-    u_mat = u ** u_powers
-    v_mat = v ** v_powers
-
     # Homogeneous control points
     pw = np.insert(p, p.shape[-1], 1.0, axis=2)
     pw = pw * w[:, :, np.newaxis]
 
-    bu = np.dot(u_mat.T, coefficient_matrices[n])
-    bv = np.dot(v_mat.T, coefficient_matrices[m])
-    a = np.dot(bv, pw)
-    b = np.dot(bu, a)
+    b = bezier_surf_anyderiv_grid(pw, nu, nv, 0, 0)
     return b[:, :, :-1] / b[:, :, -1][:, :, np.newaxis]
 
@@ -43,3 +43,69 @@ def test_bezier_surf_eval_grid(p_surf: NDArray[np.float64]):
     rust_surf = np.array(rust_nurbs.bezier_surf_eval_grid(p_surf, 50, 50))
     assert np.all(np.isclose(np_surf, rust_surf))
 
+
+def test_bernstein_basis_anyderiv(p_curve: NDArray[np.float64]):
+    t = np.linspace(0.0, 1.0, 150)
+    for deriv_order in range(3):
+        b = np_nurbs.bernstein_basis_anyderiv(len(p_curve) - 1, t, deriv_order)
+        np_curve = np_nurbs.bezier_curve_anyderiv_grid(p_curve, 150, deriv_order)
+        assert np.all(np.isclose(b @ p_curve, np_curve))
+
+
+def test_bezier_surf_dsdu_grid(p_surf: NDArray[np.float64]):
+    np_surf = np_nurbs.bezier_surf_dsdu_grid(p_surf, 50, 50)
+    rust_surf = np.array(rust_nurbs.bezier_surf_dsdu_grid(p_surf, 50, 50))
+    assert np.all(np.isclose(np_surf, rust_surf))
+
+
+def test_bezier_surf_dsdv_grid(p_surf: NDArray[np.float64]):
+    np_surf = np_nurbs.bezier_surf_dsdv_grid(p_surf, 50, 50)
+    rust_surf = np.array(rust_nurbs.bezier_surf_dsdv_grid(p_surf, 50, 50))
+    assert np.all(np.isclose(np_surf, rust_surf))
+
+
+def test_bezier_surf_first_derivs_basis(p_surf: NDArray[np.float64]):
+    p_batch = np.stack((p_surf, p_surf[::-1], 2.0 * p_surf))
+    u = np.linspace(0.0, 1.0, 30)
+    v = np.linspace(0.0, 1.0, 20)
+    bu, bv = np_nurbs.bernstein_basis_anyderiv(9, u, 0), np_nurbs.bernstein_basis_anyderiv(9, v, 0)
+    dbu, dbv = np_nurbs.bernstein_basis_anyderiv(9, u, 1), np_nurbs.bernstein_basis_anyderiv(9, v, 1)
+    s, dsdu, dsdv = np_nurbs.bezier_surf_first_derivs_basis(p_batch, bu, bv, dbu, dbv)
+    assert np.all(np.isclose(s, np_nurbs.bezier_surf_eval_basis(p_batch, bu, bv)))
+    for i, p in enumerate(p_batch):
+        rust_surf = np.array(rust_nurbs.bezier_surf_eval_grid(p, 30, 20))
+        rust_dsdu = np.array(rust_nurbs.bezier_surf_dsdu_grid(p, 30, 20))
+        rust_dsdv = np.array(rust_nurbs.bezier_surf_dsdv_grid(p, 30, 20))
+        assert np.all(np.isclose(s[i], rust_surf))
+        assert np.all(np.isclose(dsdu[i], rust_dsdu))
+        assert np.all(np.isclose(dsdv[i], rust_dsdv))
+
+
+def test_power_basis_kernels(p_curve: NDArray[np.float64]):
+    t = np.linspace(0.0, 1.0, 150)
+    c = np.dot(np_nurbs.coefficient_matrices[len(p_curve) - 1], p_curve)
+    matmul = np_nurbs.power_basis_eval_matmul(c, t)
+    horner = np_nurbs.power_basis_eval_horner(c, t)
+    assert np.all(np.isclose(matmul, horner))
+    c_batch = c.reshape(len(c), 1, 3) * np.array([1.0, -2.0])[:, np.newaxis]
+    assert np.all(np.isclose(np_nurbs.power_basis_eval_matmul(c_batch, t),
+                             np_nurbs.power_basis_eval_horner(c_batch, t)))
+    assert np.all(np.isclose(horner, np_nurbs.bezier_curve_eval_grid(p_curve, 150)))
+
+
+def test_power_basis_kernel_selection(monkeypatch: pytest.MonkeyPatch):
+    large_nt = np_nurbs.kernels.HORNER_MIN_NT_PER_BATCH * 3
+    assert not np_nurbs.use_horner_kernel(150, 3)
+    assert np_nurbs.use_horner_kernel(large_nt, 3)
+    assert not np_nurbs.use_horner_kernel(large_nt, 30)
+    assert np_nurbs.uniform_parameters(150) is np_nurbs.uniform_parameters(150)
+    assert np_nurbs.uniform_parameters(10 ** 5) is not np_nurbs.uniform_parameters(10 ** 5)
+
+    calls = []
+    monkeypatch.setattr(np_nurbs.kernels, "power_basis_eval_horner", lambda c, t: calls.append("horner"))
+    monkeypatch.setattr(np_nurbs.kernels, "power_basis_eval_matmul", lambda c, t: calls.append("matmul"))
+    c = np.random.uniform(low=-5.0, high=5.0, size=(10, 3))
+    np_nurbs.power_basis_eval(c, np.linspace(0.0, 1.0, 150))
+    np_nurbs.power_basis_eval(c, np.linspace(0.0, 1.0, large_nt))
+    np_nurbs.power_basis_eval(np.zeros((10, 5, 6)), np.linspace(0.0, 1.0, large_nt))
+    assert calls == ["matmul", "horner", "matmul"]
@@ -0,0 +1,138 @@
+"""
+Tests bounding volume hierarchy queries against brute-force
+bounding box checks
+"""
+import pytest
+
+from numpy.typing import NDArray
+import numpy as np
+import np_nurbs
+
+
+@pytest.fixture
+def p_surfs() -> NDArray[np.float64]:
+    offsets = np.random.uniform(low=-20.0, high=20.0, size=(500, 1, 1, 3))
+    return np.random.uniform(low=-1.0, high=1.0, size=(500, 4, 4, 3)) + offsets
+
+
+def _brute_force_overlaps(
+    p: NDArray[np.float64],
+    lo: NDArray[np.float64],
+    hi: NDArray[np.float64],
+) -> set[tuple[int, int]]:
+    p_lo, p_hi = p.min(axis=(1, 2)), p.max(axis=(1, 2))
+    overlap = np.all((p_lo[np.newaxis] <= hi[:, np.newaxis]) & (lo[:, np.newaxis] <= p_hi[np.newaxis]), axis=-1)
+    return set(zip(*[idx.tolist() for idx in np.nonzero(overlap)]))
+
+
+def test_bvh_query_boxes(p_surfs: NDArray[np.float64]):
+    bvh = np_nurbs.BezierBVH(p_surfs)
+    lo = np.random.uniform(low=-20.0, high=20.0, size=(100, 3))
+    hi = lo + 3.0
+    query_idx, patch_idx = bvh.query_boxes(lo, hi)
+    assert set(zip(query_idx.tolist(), patch_idx.tolist())) == _brute_force_overlaps(p_surfs, lo, hi)
+
+
+def test_bvh_refit(p_surfs: NDArray[np.float64]):
+    bvh = np_nurbs.BezierBVH(p_surfs)
+    moved = np.arange(0, 500, 7)
+    p_surfs[moved] += np.random.uniform(low=-5.0, high=5.0, size=(len(moved), 1, 1, 3))
+    bvh.refit(p_surfs[moved], moved)
+    lo = np.random.uniform(low=-20.0, high=20.0, size=(100, 3))
+    hi = lo + 3.0
+    query_idx, patch_idx = bvh.query_boxes(lo, hi)
+    assert set(zip(query_idx.tolist(), patch_idx.tolist())) == _brute_force_overlaps(p_surfs, lo, hi)
+
+
+def test_bvh_surf_nearest_grid(p_surfs: NDArray[np.float64]):
+    bvh = np_nurbs.BezierBVH(p_surfs)
+    points = np.random.uniform(low=-20.0, high=20.0, size=(20, 3))
+    patch_idx, u, v, dist = np_nurbs.bvh_surf_nearest_grid(bvh, p_surfs, points, 10, 10)
+    grids = np.array([np_nurbs.bezier_surf_eval_grid(p, 10, 10) for p in p_surfs]).reshape(-1, 3)
+    brute_dist = np.linalg.norm(points[:, np.newaxis] - grids[np.newaxis], axis=-1).min(axis=1)
+    assert np.all(np.isclose(dist, brute_dist))
+    nearest = np.array([np_nurbs.bezier_surf_eval_grid(p_surfs[i], 10, 10)[round(ui * 9), round(vi * 9)]
+                        for i, ui, vi in zip(patch_idx, u, v)])
+    assert np.all(np.isclose(np.linalg.norm(nearest - points, axis=-1), dist))
+
+
+def test_bvh_surf_nearest_grid_mixed_degrees(p_surfs: NDArray[np.float64]):
+    p_mixed = [p if i % 2 else p[:3, :2] for i, p in enumerate(p_surfs)]
+    w_mixed = [np.random.uniform(low=0.5, high=2.0, size=p.shape[:2]) for p in p_mixed]
+    bvh = np_nurbs.BezierBVH(p_mixed)
+    points = np.random.uniform(low=-20.0, high=20.0, size=(20, 3))
+    patch_idx, u, v, dist = np_nurbs.bvh_surf_nearest_grid(bvh, p_mixed, points, 10, 10, w_mixed)
+    grids = np.array([np_nurbs.rational_bezier_surf_eval_grid(p, w, 10, 10)
+                      for p, w in zip(p_mixed, w_mixed)]).reshape(-1, 3)
+    brute_dist = np.linalg.norm(points[:, np.newaxis] - grids[np.newaxis], axis=-1).min(axis=1)
+    assert np.all(np.isclose(dist, brute_dist))
+
+
+def test_bvh_query_rays(p_surfs: NDArray[np.float64]):
+    bvh = np_nurbs.BezierBVH(p_surfs)
+    origins = np.random.uniform(low=-25.0, high=25.0, size=(100, 3))
+    directions = np.random.normal(size=(100, 3))
+    directions[:20, 0] = 0.0
+    directions[10:30, 2] = 0.0
+    query_idx, patch_idx = bvh.query_rays(origins, directions)
+
+    # Brute-force slab test, handling zero direction components by
+    # requiring the origin to lie within the slab
+    p_lo = p_surfs.min(axis=(1, 2))[np.newaxis]
+    p_hi = p_surfs.max(axis=(1, 2))[np.newaxis]
+    o, d = origins[:, np.newaxis], directions[:, np.newaxis]
+    parallel = d == 0.0
+    safe_d = np.where(parallel, 1.0, d)
+    t1, t2 = (p_lo - o) / safe_d, (p_hi - o) / safe_d
+    t_near = np.where(parallel, -np.inf, np.minimum(t1, t2)).max(axis=-1)
+    t_far = np.where(parallel, np.inf, np.maximum(t1, t2)).min(axis=-1)
+    inside = np.all(~parallel | ((p_lo <= o) & (o <= p_hi)), axis=-1)
+    hit = inside & (t_near <= t_far) & (t_far >= 0.0)
+    expected = set(zip(*[idx.tolist() for idx in np.nonzero(hit)]))
+    assert set(zip(query_idx.tolist(), patch_idx.tolist())) == expected
+
+
+def test_bvh_query_nearest(p_surfs: NDArray[np.float64]):
+    bvh = np_nurbs.BezierBVH(p_surfs)
+    points = np.random.uniform(low=-20.0, high=20.0, size=(100, 3))
+    query_idx, patch_idx = bvh.query_nearest(points)
+
+    # Every patch whose box is closer than the smallest farthest-corner
+    # distance may hold the nearest point
+    p_lo = p_surfs.min(axis=(1, 2))[np.newaxis]
+    p_hi = p_surfs.max(axis=(1, 2))[np.newaxis]
+    x = points[:, np.newaxis]
+    min_dist = np.linalg.norm(x - np.clip(x, p_lo, p_hi), axis=-1)
+    max_dist = np.linalg.norm(np.maximum(np.abs(x - p_lo), np.abs(x - p_hi)), axis=-1)
+    candidates = min_dist <= max_dist.min(axis=1, keepdims=True)
+    expected = set(zip(*[idx.tolist() for idx in np.nonzero(candidates)]))
+    assert set(zip(query_idx.tolist(), patch_idx.tolist())) == expected
+
+
+def test_bvh_skips_padding_nodes():
+    # 130 patches fill 33 leaves, which are padded to 64
+    p = np.random.uniform(low=-1.0, high=1.0, size=(130, 4, 4, 3))
+    bvh = np_nurbs.BezierBVH(p)
+    tested = []
+
+    def box_test(q, node_lo, node_hi):
+        tested.append((node_lo, node_hi))
+        return np.ones(len(q), dtype=bool)
+
+    query_idx, patch_idx = bvh._traverse(1, box_test)
+    assert np.array_equal(np.sort(patch_idx), np.arange(130))
+    node_lo, node_hi = np.concatenate([lo for lo, _ in tested]), np.concatenate([hi for _, hi in tested])
+    assert np.all(node_lo <= node_hi)
+    used_nodes = sum(-(-33 // 2 ** (bvh.depth - level)) for level in range(bvh.depth + 1))
+    assert len(node_lo) == used_nodes + 130
+
+
+def test_bvh_empty():
+    bvh = np_nurbs.BezierBVH(np.zeros((0, 4, 4, 3)))
+    points = np.random.uniform(low=-1.0, high=1.0, size=(5, 3))
+    for query_idx, patch_idx in (
+        bvh.query_boxes(points, points + 1.0),
+        bvh.query_rays(points, points),
+        bvh.query_nearest(points),
+    ):
+        assert len(query_idx) == 0 and len(patch_idx) == 0
@@ -0,0 +1,114 @@
+"""
+Tests Gauss-Legendre mass-property integrals against
+closed-form results
+"""
+import pytest
+
+from numpy.typing import NDArray
+import numpy as np
+import np_nurbs
+
+
+@pytest.fixture
+def p_quarter_circle() -> NDArray[np.float64]:
+    return np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+
+
+@pytest.fixture
+def w_quarter_circle() -> NDArray[np.float64]:
+    return np.array([1.0, 1.0 / np.sqrt(2.0), 1.0])
+
+
+@pytest.fixture
+def p_box() -> NDArray[np.float64]:
+    """
+    Six bilinear patches bounding the box [1, 3] x [0, 1] x [0, 2],
+    each oriented with an outward normal
+    """
+    lo, hi = np.array([1.0, 0.0, 0.0]), np.array([3.0, 1.0, 2.0])
+    patches = []
+    for axis in range(3):
+        a, b = (axis + 1) % 3, (axis + 2) % 3
+        for side, sign in ((lo, -1.0), (hi, 1.0)):
+            patch = np.empty((2, 2, 3))
+            for i in range(2):
+                for j in range(2):
+                    patch[i, j, axis] = side[axis]
+                    patch[i, j, a] = (lo, hi)[i][a]
+                    patch[i, j, b] = (lo, hi)[j][b]
+            patches.append(patch if sign > 0.0 else patch.swapaxes(0, 1))
+    return np.array(patches)
+
+
+def test_rational_bezier_curve_length(
+    p_quarter_circle: NDArray[np.float64],
+    w_quarter_circle: NDArray[np.float64]
+):
+    length = np_nurbs.rational_bezier_curve_length(p_quarter_circle, w_quarter_circle)
+    assert length.shape == (1,)
+    assert np.isclose(length[0], 0.5 * np.pi)
+
+
+def test_bezier_curve_length():
+    # Perturbed straight lines keep the speed bounded away from zero,
+    # so the polyline reference converges without cusps
+    direction = np.random.uniform(low=-5.0, high=5.0, size=(10, 1, 3))
+    p = np.linspace(0.0, 1.0, 4)[np.newaxis, :, np.newaxis] * direction
+    p += np.random.uniform(low=-0.2, high=0.2, size=(10, 4, 3))
+    lengths = np_nurbs.bezier_curve_length(p)
+    for pi, length in zip(p, lengths):
+        polyline = np_nurbs.bezier_curve_eval_grid(pi, 20000)
+        assert np.isclose(length, np.sum(np.linalg.norm(np.diff(polyline, axis=0), axis=1)))
+
+
+def test_rational_bezier_surf_area(
+    p_quarter_circle: NDArray[np.float64],
+    w_quarter_circle: NDArray[np.float64]
+):
+    # Quarter cylinder of radius 1 and height 2
+    p = np.stack([np.column_stack((p_quarter_circle, np.full(3, z))) for z in (0.0, 2.0)], axis=1)
+    w = np.column_stack((w_quarter_circle, w_quarter_circle))
+    assert np.isclose(np_nurbs.rational_bezier_surf_area(p, w)[0], np.pi)
+
+
+def test_bezier_surf_volume_centroid(p_box: NDArray[np.float64]):
+    assert np.all(np.isclose(np_nurbs.bezier_surf_area(p_box), [2.0, 2.0, 4.0, 4.0, 2.0, 2.0]))
+    assert np.isclose(np_nurbs.bezier_surf_volume(p_box), 4.0)
+    assert np.all(np.isclose(np_nurbs.bezier_surf_volume_centroid(p_box), [2.0, 0.5, 1.0]))
+    w = np.random.uniform(low=0.5, high=2.0, size=(6, 1, 1)) * np.ones((6, 2, 2))
+    assert np.isclose(np_nurbs.rational_bezier_surf_volume(p_box, w), 4.0)
+    assert np.all(np.isclose(np_nurbs.rational_bezier_surf_volume_centroid(p_box, w), [2.0, 0.5, 1.0]))
+
+
+def test_bezier_surf_volume_mixed_degrees(p_box: NDArray[np.float64]):
+    # Elevate half of the faces to degree 2 in u, which leaves the
+    # geometry unchanged but requires a second same-degree batch
+    elevated = np.stack((p_box[3:, 0], 0.5 * (p_box[3:, 0] + p_box[3:, 1]), p_box[3:, 1]), axis=1)
+    p = [p_box[:3], elevated]
+    assert np.isclose(np_nurbs.bezier_surf_volume(p), 4.0)
+    assert np.all(np.isclose(np_nurbs.bezier_surf_volume_centroid(p), [2.0, 0.5, 1.0]))
+
+
+def test_rational_bezier_surf_volume_cylinder(
+    p_quarter_circle: NDArray[np.float64],
+    w_quarter_circle: NDArray[np.float64]
+):
+    # Closed cylinder of radius 1 and height 2 centered on the axis
+    # through (1, 2) and starting at z = 3, built from four side
+    # patches and eight degenerate cap patches
+    origin = np.array([1.0, 2.0, 3.0])
+    side, top, bottom = [], [], []
+    for k in range(4):
+        c, s = np.cos(0.5 * np.pi * k), np.sin(0.5 * np.pi * k)
+        arc = p_quarter_circle @ np.array([[c, s], [-s, c]])
+        arc_low = np.column_stack((arc, np.zeros(3))) + origin
+        arc_high = arc_low + np.array([0.0, 0.0, 2.0])
+        side.append(np.stack((arc_low, arc_high), axis=1))
+        top.append(np.stack((arc_high, np.tile(origin + [0.0, 0.0, 2.0], (3, 1))), axis=1))
+        bottom.append(np.stack((np.tile(origin, (3, 1)), arc_low), axis=1))
+    p = [np.array(side), np.array(top + bottom)]
+    w_patch = np.column_stack((w_quarter_circle, w_quarter_circle))
+    w = [np.tile(w_patch, (4, 1, 1)), np.tile(w_patch, (8, 1, 1))]
+    assert np.isclose(np_nurbs.rational_bezier_surf_volume(p, w), 2.0 * np.pi)
+    assert np.all(np.isclose(np_nurbs.rational_bezier_surf_volume_centroid(p, w), origin + [0.0, 0.0, 1.0]))
+    assert np.all(np.isclose(np_nurbs.rational_bezier_surf_area(p[0], w[0]), np.pi))
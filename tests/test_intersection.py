@@ -0,0 +1,77 @@
+"""
+Tests batched Bézier curve-curve and curve-surface intersection
+"""
+import pytest
+
+from numpy.typing import NDArray
+import numpy as np
+import np_nurbs
+
+
+@pytest.fixture
+def p_curve_pairs() -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    return (
+        np.random.uniform(low=-5.0, high=5.0, size=(200, 4, 2)),
+        np.random.uniform(low=-5.0, high=5.0, size=(200, 5, 2)),
+    )
+
+
+def _polyline_crossing_counts(
+    p1: NDArray[np.float64],
+    p2: NDArray[np.float64],
+    nt: int,
+) -> list[int]:
+    """
+    Counts the segment-segment crossings between the sampled polylines
+    of each pair of planar curves
+    """
+    counts = []
+    for a, b in zip(p1, p2):
+        pa = np_nurbs.bezier_curve_eval_grid(a, nt)
+        pb = np_nurbs.bezier_curve_eval_grid(b, nt)
+        a0, da = pa[:-1, np.newaxis], np.diff(pa, axis=0)[:, np.newaxis]
+        b0, db = pb[np.newaxis, :-1], np.diff(pb, axis=0)[np.newaxis]
+        denom = da[..., 0] * db[..., 1] - da[..., 1] * db[..., 0]
+        diff = b0 - a0
+        s = (diff[..., 0] * db[..., 1] - diff[..., 1] * db[..., 0]) / denom
+        t = (diff[..., 0] * da[..., 1] - diff[..., 1] * da[..., 0]) / denom
+        counts.append(int(np.sum((s >= 0.0) & (s < 1.0) & (t >= 0.0) & (t < 1.0))))
+    return counts
+
+
+def test_bezier_curve_curve_intersect_parabolas():
+    p1 = np.array([[0.0, 0.0], [0.5, 2.0], [1.0, 0.0]])
+    p2 = np.array([[0.0, 1.0], [0.5, -1.0], [1.0, 1.0]])
+    pair_idx, t, s = np_nurbs.bezier_curve_curve_intersect(p1, p2)
+    expected = np.array([0.5 - 0.5 / np.sqrt(2.0), 0.5 + 0.5 / np.sqrt(2.0)])
+    assert np.all(pair_idx == 0)
+    assert np.all(np.isclose(t, expected))
+    assert np.all(np.isclose(s, expected))
+
+
+def test_bezier_curve_curve_intersect_batch(
+    p_curve_pairs: tuple[NDArray[np.float64], NDArray[np.float64]]
+):
+    p1, p2 = p_curve_pairs
+    pair_idx, t, s = np_nurbs.bezier_curve_curve_intersect(p1, p2)
+    for i, ti, si in zip(pair_idx, t, s):
+        c1 = np_nurbs.bernstein_basis_anyderiv(3, np.array([ti])) @ p1[i]
+        c2 = np_nurbs.bernstein_basis_anyderiv(4, np.array([si])) @ p2[i]
+        assert np.all(np.isclose(c1, c2))
+
+    # Every intersection must be found, not just valid ones
+    counts = np.bincount(pair_idx, minlength=len(p1))
+    assert np.array_equal(counts, _polyline_crossing_counts(p1, p2, 300))
+
+
+def test_bezier_curve_surf_intersect_plane():
+    line = np.array([[0.3, 0.4, -1.0], [0.3, 0.4, 1.0]])
+    plane = np.array([
+        [[0.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+        [[1.0, 0.0, 0.0], [1.0, 1.0, 0.0]],
+    ])
+    pair_idx, t, u, v = np_nurbs.bezier_curve_surf_intersect(line, plane)
+    assert np.all(pair_idx == 0)
+    assert np.all(np.isclose(t, [0.5]))
+    assert np.all(np.isclose(u, [0.3]))
+    assert np.all(np.isclose(v, [0.4]))
@@ -0,0 +1,58 @@
+"""
+Tests Bézier surface tessellation and binary mesh export
+"""
+import pytest
+
+from numpy.typing import NDArray
+import numpy as np
+import np_nurbs
+
+
+@pytest.fixture
+def p_surfs() -> NDArray[np.float64]:
+    return np.random.uniform(low=-5.0, high=5.0, size=(6, 4, 5, 3))
+
+
+def test_grid_triangle_indices():
+    faces = np_nurbs.grid_triangle_indices(4, 3)
+    assert faces.shape == (12, 3)
+    assert np.array_equal(np.unique(faces), np.arange(12))
+    assert np_nurbs.grid_triangle_indices(4, 3) is faces
+
+
+def test_bezier_surf_tessellate_grid(p_surfs: NDArray[np.float64]):
+    vertices, normals, faces = np_nurbs.bezier_surf_tessellate_grid(p_surfs, 20, 15)
+    assert vertices.shape == normals.shape == (6 * 20 * 15, 3)
+    assert faces.shape == (6 * 2 * 19 * 14, 3)
+    for i, p in enumerate(p_surfs):
+        patch = slice(i * 300, (i + 1) * 300)
+        assert np.all(np.isclose(vertices[patch], np_nurbs.bezier_surf_eval_grid(p, 20, 15).reshape(-1, 3)))
+        analytic = np.cross(
+            np_nurbs.bezier_surf_dsdu_grid(p, 20, 15),
+            np_nurbs.bezier_surf_dsdv_grid(p, 20, 15),
+        ).reshape(-1, 3)
+        assert np.all(np.isclose(np.cross(normals[patch], analytic), 0.0))
+        assert np.all(np.sum(normals[patch] * analytic, axis=1) >= 0.0)
+
+
+def test_write_stl(tmp_path, p_surfs: NDArray[np.float64]):
+    vertices, _, faces = np_nurbs.bezier_surf_tessellate_grid(p_surfs, 10, 10)
+    np_nurbs.write_stl(tmp_path / "mesh.stl", vertices, faces)
+    np_nurbs.write_bezier_surfs_stl(tmp_path / "stream.stl", p_surfs, 10, 10, chunk_size=4)
+    data = (tmp_path / "mesh.stl").read_bytes()
+    assert data == (tmp_path / "stream.stl").read_bytes()
+    assert np.frombuffer(data[80:84], dtype="<u4")[0] == len(faces)
+    facets = np.frombuffer(data[84:], dtype=np.dtype([("n", "<f4", 3), ("v", "<f4", (3, 3)), ("a", "<u2")]))
+    assert np.all(np.isclose(facets["v"], vertices[faces], atol=1e-5))
+
+
+def test_write_ply(tmp_path, p_surfs: NDArray[np.float64]):
+    vertices, normals, faces = np_nurbs.bezier_surf_tessellate_grid(p_surfs, 10, 10)
+    np_nurbs.write_ply(tmp_path / "mesh.ply", vertices, faces, normals)
+    data = (tmp_path / "mesh.ply").read_bytes()
+    header_end = data.index(b"end_header\n") + len(b"end_header\n")
+    assert f"element vertex {len(vertices)}".encode() in data[:header_end]
+    body = np.frombuffer(data[header_end:header_end + 24 * len(vertices)], dtype="<f4").reshape(-1, 6)
+    assert np.all(np.isclose(body[:, :3], vertices, atol=1e-5))
+    face_data = np.frombuffer(data[header_end + 24 * len(vertices):], dtype=[("c", "u1"), ("i", "<i4", 3)])
+    assert np.array_equal(face_data["i"], faces)